@@ -1,53 +1,71 @@
 """Setup configuration for 🌸 Sakura Sumi - OCR Compression System."""
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
-# Read README for long description
-readme_file = Path(__file__).parent / 'README.md'
-long_description = readme_file.read_text() if readme_file.exists() else ''
 
-# Read requirements
-requirements_file = Path(__file__).parent / 'requirements.txt'
-requirements = []
-if requirements_file.exists():
-    requirements = [
-        line.strip() 
-        for line in requirements_file.read_text().splitlines()
-        if line.strip() and not line.startswith('#')
-    ]
+def _load_metadata():
+    """Read README and requirements (only when setup() actually runs)."""
+    root = Path(__file__).parent
+    
+    # Read README for long description
+    readme_file = root / 'README.md'
+    long_description = readme_file.read_text(encoding='utf-8') if readme_file.exists() else ''
+    
+    # Read requirements
+    requirements_file = root / 'requirements.txt'
+    requirements = []
+    if requirements_file.exists():
+        with requirements_file.open('r', encoding='utf-8') as handle:
+            for line in handle:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    requirements.append(line)
+    
+    return long_description, requirements
 
-setup(
-    name='ocr-compression',
-    version='1.0.0',
-    description='🌸 Sakura Sumi - Visual Token Arbitrage Engine - Maximize AI context and intelligence through high-density visual arbitrage',
-    long_description=long_description,
-    long_description_content_type='text/markdown',
-    author='Sakura Sumi Contributors',
-    author_email='',
-    url='https://github.com/yourusername/ocr-compression',
-    packages=find_packages(where='src'),
-    package_dir={'': 'src'},
-    python_requires='>=3.8',
-    install_requires=requirements,
-    entry_points={
-        'console_scripts': [
-            'ocr-compress=main:main',
-            'ocr-web=scripts.run_web:main',
+
+if __name__ == '__main__':
+    long_description, requirements = _load_metadata()
+    
+    setup(
+        name='ocr-compression',
+        version='1.0.0',
+        description='🌸 Sakura Sumi - Visual Token Arbitrage Engine - Maximize AI context and intelligence through high-density visual arbitrage',
+        long_description=long_description,
+        long_description_content_type='text/markdown',
+        author='Sakura Sumi Contributors',
+        author_email='',
+        url='https://github.com/yourusername/ocr-compression',
+        # Explicit list: modules import each other as `src.*`, so no package_dir remap
+        packages=[
+            'src',
+            'src.compression',
+            'src.scripts',
+            'src.utils',
+            'src.web',
+        ],
+        package_data={'src.web': ['templates/*.html']},
+        python_requires='>=3.8',
+        install_requires=requirements,
+        entry_points={
+            'console_scripts': [
+                'ocr-compress=src.main:main',
+                'ocr-web=src.scripts.run_web:main',
+            ],
+        },
+        classifiers=[
+            'Development Status :: 4 - Beta',
+            'Intended Audience :: Developers',
+            'License :: OSI Approved :: MIT License',
+            'Programming Language :: Python :: 3',
+            'Programming Language :: Python :: 3.8',
+            'Programming Language :: Python :: 3.9',
+            'Programming Language :: Python :: 3.10',
+            'Programming Language :: Python :: 3.11',
+            'Topic :: Software Development :: Libraries :: Python Modules',
         ],
-    },
-    classifiers=[
-        'Development Status :: 4 - Beta',
-        'Intended Audience :: Developers',
-        'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.8',
-        'Programming Language :: Python :: 3.9',
-        'Programming Language :: Python :: 3.10',
-        'Programming Language :: Python :: 3.11',
-        'Topic :: Software Development :: Libraries :: Python Modules',
-    ],
-    include_package_data=True,
-    zip_safe=False,
-)
+        include_package_data=True,
+        zip_safe=False,
+    )
 
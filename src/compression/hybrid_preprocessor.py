@@ -11,7 +11,8 @@ Trade-offs:
 """
 
 import re
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
 
 
 # HYBRID_MODE_START
@@ -85,6 +86,22 @@ SYMBOL_MAP: Dict[str, str] = {
     'µ': 'mu',   # U+00B5 MICRO SIGN
 }
 
+# Single-pass translation table and key set derived from SYMBOL_MAP
+_TRANSLATE_TABLE = str.maketrans(SYMBOL_MAP)
+_SYMBOL_KEYS = frozenset(SYMBOL_MAP)
+
+# Operator padding fused with double-space cleanup. Consecutive operators are
+# matched as one run so adjacent padding never leaves a double space behind.
+_OPERATOR_PAD_RE = re.compile(r'(?<!\s)([+\-*/=<>!]+)(?!\s)|  +')
+
+
+def _pad_operator(match: re.Match) -> str:
+    """Pad an operator run with single spaces, or collapse a run of spaces."""
+    operators = match.group(1)
+    if operators is None:
+        return ' '
+    return f" {' '.join(operators)} "
+
 
 def preprocess_code(content: str, mode: str = 'hybrid') -> Tuple[str, Dict[str, str]]:
     """
@@ -101,16 +118,17 @@ def preprocess_code(content: str, mode: str = 'hybrid') -> Tuple[str, Dict[str,
     if mode not in ('code', 'hybrid'):
         return content, {}
     
-    processed = content
-    translation_dict = {}
-    
-    # Apply symbol replacements
-    for unicode_char, ascii_replacement in SYMBOL_MAP.items():
-        if unicode_char in processed:
-            # Track what was replaced for the translation dictionary
-            if unicode_char not in translation_dict:
-                translation_dict[unicode_char] = ascii_replacement
-            processed = processed.replace(unicode_char, ascii_replacement)
+    # Pure-ASCII content (the common case for source code) has nothing to replace
+    if content.isascii():
+        processed = content
+        translation_dict = {}
+    else:
+        # Track what will be replaced for the translation dictionary
+        present = _SYMBOL_KEYS.intersection(content)
+        translation_dict = {char: SYMBOL_MAP[char] for char in present}
+
+        # Apply all symbol replacements in a single pass
+        processed = content.translate(_TRANSLATE_TABLE) if present else content
     
     # Apply padding transformations for better OCR fidelity
     # Add spacing around operators that OCR often misreads
@@ -120,9 +138,8 @@ def preprocess_code(content: str, mode: str = 'hybrid') -> Tuple[str, Dict[str,
         # Simple approach: pad operators outside of quotes
         # Note: This is a simplified implementation - full parsing would be more accurate
         # but may add ~5-15% token bloat as trade-off for OCR fidelity
-        processed = re.sub(r'(?<!\s)([+\-*/=<>!])(?!\s)', r' \1 ', processed)
-        # Clean up double spaces (but preserve intentional spacing)
-        processed = re.sub(r'  +', ' ', processed)
+        # Double spaces are cleaned up in the same pass
+        processed = _OPERATOR_PAD_RE.sub(_pad_operator, processed)
     
     return processed, translation_dict
 
@@ -140,23 +157,28 @@ def generate_translation_dict_yaml(translation_dict: Dict[str, str]) -> str:
     if not translation_dict:
         return ""
     
-    yaml_lines = [
-        "---",
-        "# Hybrid Mode Translation Dictionary",
-        "# Maps Unicode characters to ASCII equivalents for OCR fidelity",
-        "# Use this to reverse-translate OCR output if needed",
-        "translations:"
-    ]
-    
-    for unicode_char, ascii_replacement in sorted(translation_dict.items()):
-        # Escape Unicode for YAML
-        unicode_hex = f"U+{ord(unicode_char):04X}"
-        yaml_lines.append(f"  '{unicode_hex}': '{ascii_replacement}'  # {unicode_char}")
-    
-    yaml_lines.append("---")
-    yaml_lines.append("")
-    
-    return "\n".join(yaml_lines)
+    # Batch runs see the same small subsets of SYMBOL_MAP over and over
+    return _translation_yaml(frozenset(translation_dict.items()))
+
+
+_YAML_HEADER = (
+    "---\n"
+    "# Hybrid Mode Translation Dictionary\n"
+    "# Maps Unicode characters to ASCII equivalents for OCR fidelity\n"
+    "# Use this to reverse-translate OCR output if needed\n"
+    "translations:\n"
+)
+
+
+@lru_cache(maxsize=256)
+def _translation_yaml(translation_items: FrozenSet[Tuple[str, str]]) -> str:
+    """Render YAML frontmatter for a hashable set of translation items."""
+    # Escape Unicode for YAML as U+XXXX keys, one line per mapping
+    mappings = "".join(
+        f"  'U+{ord(unicode_char):04X}': '{ascii_replacement}'  # {unicode_char}\n"
+        for unicode_char, ascii_replacement in sorted(translation_items)
+    )
+    return _YAML_HEADER + mappings + "---\n"
 
 
 def prepend_dict(content: str, translation_dict: Dict[str, str]) -> str:
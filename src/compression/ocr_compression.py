@@ -1,7 +1,15 @@
 """Optional DeepSeek-OCR integration for advanced compression."""
 
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+import importlib.util
+import os
+import threading
 import warnings
 
 # Try to import optional dependencies
@@ -9,47 +17,57 @@ OCR_AVAILABLE = False
 try:
     # These would be the actual imports if DeepSeek-OCR is available
     # For now, we'll create a placeholder implementation
-    # import vllm
-    # from transformers import AutoTokenizer, AutoModelForCausalLM
+    # Heavy imports (vllm, transformers) belong in _load_model so importing
+    # this module stays cheap; availability is probed via _probe_dependencies
     OCR_AVAILABLE = False  # Set to True when dependencies are installed
 except ImportError:
     OCR_AVAILABLE = False
 
+# Missing-dependency warning fires at most once per process; set SAKURA_QUIET=1 to silence it
+QUIET_ENV_FLAG = 'SAKURA_QUIET'
+_dependency_warning_emitted = False
+
+# Lightweight per-file error record kept in a bounded log
+OCRError = namedtuple('OCRError', ['file', 'error'])
+
 
 class OCRCompressor:
     """Optional OCR compression using DeepSeek-OCR for maximum compression ratios."""
     
-    # Compression mode configurations
-    COMPRESSION_MODES = {
-        'small': {
+    # Compression mode configurations (read-only; shared by all instances)
+    COMPRESSION_MODES = MappingProxyType({
+        'small': MappingProxyType({
             'base_size': 1024,
             'compression_mode': 'small',
             'target_ratio': 7,
             'accuracy': 0.97,
             'description': '7x compression with 97% accuracy (recommended for code)',
-        },
-        'medium': {
+        }),
+        'medium': MappingProxyType({
             'base_size': 1024,
             'compression_mode': 'medium',
             'target_ratio': 10,
             'accuracy': 0.97,
             'description': '10x compression with 97% accuracy',
-        },
-        'large': {
+        }),
+        'large': MappingProxyType({
             'base_size': 1024,
             'compression_mode': 'large',
             'target_ratio': 15,
             'accuracy': 0.85,
             'description': '15x compression with 85-90% accuracy',
-        },
-        'maximum': {
+        }),
+        'maximum': MappingProxyType({
             'base_size': 1024,
             'compression_mode': 'maximum',
             'target_ratio': 20,
             'accuracy': 0.60,
             'description': '20x compression with 60% accuracy (not recommended for code)',
-        },
-    }
+        }),
+    })
+    
+    # Most recent errors retained in stats (older entries are dropped)
+    MAX_ERRORS = 1000
     
     def __init__(self, mode: str = 'small', cache_dir: Optional[str] = None):
         """
@@ -59,12 +77,16 @@ class OCRCompressor:
             mode: Compression mode ('small', 'medium', 'large', 'maximum')
             cache_dir: Directory for caching compressed outputs
         """
-        if not OCR_AVAILABLE:
-            warnings.warn(
-                "DeepSeek-OCR dependencies not available. "
-                "Install with: pip install vllm transformers",
-                ImportWarning
-            )
+        global _dependency_warning_emitted
+        if not OCR_AVAILABLE and not _dependency_warning_emitted:
+            _dependency_warning_emitted = True
+            if os.getenv(QUIET_ENV_FLAG, '').strip().lower() not in {'1', 'true', 'on'}:
+                warnings.warn(
+                    "DeepSeek-OCR dependencies not available. "
+                    "Install with: pip install vllm transformers",
+                    ImportWarning,
+                    stacklevel=2,
+                )
         
         if mode not in self.COMPRESSION_MODES:
             raise ValueError(f"Invalid mode: {mode}. Choose from {list(self.COMPRESSION_MODES.keys())}")
@@ -73,12 +95,13 @@ class OCRCompressor:
         self.config = self.COMPRESSION_MODES[mode]
         self.cache_dir = Path(cache_dir) if cache_dir else None
         self.model_loaded = False
+        self._lock = threading.Lock()  # Guards model loading and stats in batch mode
         self.stats = {
             'files_compressed': 0,
             'files_cached': 0,
             'total_input_size': 0,
             'total_output_size': 0,
-            'errors': [],
+            'errors': deque(maxlen=self.MAX_ERRORS),
         }
     
     def is_available(self) -> bool:
@@ -91,6 +114,8 @@ class OCRCompressor:
             raise RuntimeError("DeepSeek-OCR dependencies not available")
         
         # Placeholder for actual model loading
+        # import vllm
+        # from transformers import AutoTokenizer, AutoModelForCausalLM
         # if not self.model_loaded:
         #     self.model = load_deepseek_ocr_model()
         #     self.model_loaded = True
@@ -121,13 +146,16 @@ class OCRCompressor:
         # Check cache first
         cache_path = self._get_cache_path(pdf_path)
         if cache_path and cache_path.exists():
-            self.stats['files_cached'] += 1
+            with self._lock:
+                self.stats['files_cached'] += 1
             return cache_path
         
         try:
             # Load model if needed
             if not self.model_loaded:
-                self._load_model()
+                with self._lock:
+                    if not self.model_loaded:
+                        self._load_model()
             
             # Placeholder for actual OCR compression
             # compressed_content = self.model.compress_pdf(pdf_path, self.config)
@@ -142,30 +170,39 @@ class OCRCompressor:
             # Save compressed output
             if cache_path:
                 cache_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    f.write(compressed_content)
+                output_bytes = compressed_content.encode('utf-8')
+                cache_path.write_bytes(output_bytes)
                 
-                # Update stats
-                self.stats['files_compressed'] += 1
-                self.stats['total_input_size'] += pdf_path.stat().st_size
-                self.stats['total_output_size'] += cache_path.stat().st_size
+                # Update stats (output size is known without re-stat'ing the cache file)
+                input_size = pdf_path.stat().st_size
+                with self._lock:
+                    self.stats['files_compressed'] += 1
+                    self.stats['total_input_size'] += input_size
+                    self.stats['total_output_size'] += len(output_bytes)
                 
                 return cache_path
         
         except Exception as e:
-            self.stats['errors'].append({
-                'file': str(pdf_path),
-                'error': str(e),
-            })
+            with self._lock:
+                self.stats['errors'].append(OCRError(str(pdf_path), str(e)))
             return None
     
-    def compress_pdfs_batch(self, pdf_paths: List[Path], progress_callback: Optional[callable] = None) -> Dict[str, Path]:
+    def compress_pdfs_batch(
+        self,
+        pdf_paths: List[Path],
+        progress_callback: Optional[callable] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Path]:
         """
         Compress multiple PDF files in batch.
         
+        Files are compressed concurrently on a thread pool. Model inference runs
+        in native code, so threads avoid process spawn and pickling overhead.
+        
         Args:
             pdf_paths: List of PDF file paths
             progress_callback: Optional callback function(file_path, success)
+            max_workers: Maximum number of worker threads (None = auto)
             
         Returns:
             Dictionary mapping original PDF paths to compressed output paths
@@ -174,14 +211,16 @@ class OCRCompressor:
             return {}
         
         results = {}
+        workers = max_workers or (cpu_count() - 1 or 1)
         
-        for pdf_path in pdf_paths:
-            compressed_path = self.compress_pdf(pdf_path)
-            if compressed_path:
-                results[str(pdf_path)] = compressed_path
-            
-            if progress_callback:
-                progress_callback(pdf_path, compressed_path is not None)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, so callbacks stay on this thread and in order
+            for pdf_path, compressed_path in zip(pdf_paths, executor.map(self.compress_pdf, pdf_paths)):
+                if compressed_path:
+                    results[str(pdf_path)] = compressed_path
+                
+                if progress_callback:
+                    progress_callback(pdf_path, compressed_path is not None)
         
         return results
     
@@ -196,6 +235,7 @@ class OCRCompressor:
         
         return {
             **self.stats,
+            'errors': [error._asdict() for error in self.stats['errors']],
             'compression_mode': self.mode,
             'compression_ratio': compression_ratio,
             'target_ratio': self.config['target_ratio'],
@@ -203,33 +243,29 @@ class OCRCompressor:
         }
     
     @classmethod
-    def get_available_modes(cls) -> Dict[str, Dict[str, Any]]:
-        """Get available compression modes and their configurations."""
-        return cls.COMPRESSION_MODES.copy()
+    def get_available_modes(cls) -> Mapping[str, Mapping[str, Any]]:
+        """Get available compression modes and their configurations (read-only view)."""
+        return cls.COMPRESSION_MODES
     
     @classmethod
     def check_dependencies(cls) -> Dict[str, bool]:
         """Check which dependencies are available."""
-        deps = {
-            'vllm': False,
-            'transformers': False,
-            'deepseek_ocr_model': False,
+        vllm_available, transformers_available = _probe_dependencies()
+        return {
+            'vllm': vllm_available,
+            'transformers': transformers_available,
+            # Check if model can be loaded
+            'deepseek_ocr_model': OCR_AVAILABLE,
         }
-        
-        try:
-            deps['vllm'] = True
-        except ImportError:
-            pass
-        
-        try:
-            deps['transformers'] = True
-        except ImportError:
-            pass
-        
-        # Check if model can be loaded
-        deps['deepseek_ocr_model'] = OCR_AVAILABLE
-        
-        return deps
+
+
+@lru_cache(maxsize=1)
+def _probe_dependencies() -> Tuple[bool, bool]:
+    """Locate optional OCR packages without importing them (importing vllm takes seconds)."""
+    return (
+        importlib.util.find_spec('vllm') is not None,
+        importlib.util.find_spec('transformers') is not None,
+    )
 
 
 def create_ocr_compressor(mode: str = 'small', cache_dir: Optional[str] = None) -> Optional[OCRCompressor]:
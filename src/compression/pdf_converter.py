@@ -1,18 +1,78 @@
 """Dense PDF conversion engine for codebase compression."""
 
+import gc
+import hashlib
 import json
-import html
+import math
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+from reportlab import Version as REPORTLAB_VERSION
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml-backed parser when PyYAML was built with it (same results as safe_load)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 from ..utils.file_discovery import FileInfo
-from .hybrid_preprocessor import preprocess_code, prepend_dict  # HYBRID_MODE_START
+from .hybrid_preprocessor import preprocess_code, generate_translation_dict_yaml  # HYBRID_MODE_START
+
+
+# Only set in dedicated worker processes (see enable_gc_pause); elsewhere the converter
+# may share the interpreter with unrelated threads, so the collector is left alone.
+_gc_pause_enabled = False
+
+
+def enable_gc_pause() -> None:
+    """Allow _gc_paused() to disable the collector in this (worker) process."""
+    global _gc_pause_enabled
+    _gc_pause_enabled = True
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector for a hot rendering loop.
+    
+    The loop allocates many short-lived objects but creates no reference cycles, so
+    generational collections only rescan the long-lived heap. Disabling the collector
+    is process-wide, so this is a no-op unless enable_gc_pause() was called by a worker
+    process that runs nothing but conversions. The previous state is restored and no
+    collection is forced afterwards.
+    """
+    if not _gc_pause_enabled or not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _has_float(data: Any) -> bool:
+    """Return True if parsed JSON data contains a float anywhere."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            return True
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return False
 
 
 class PDFConverter:
@@ -24,24 +84,52 @@ class PDFConverter:
     MARGIN = 0.3 * inch  # Minimal margins
     MAX_LINE_LENGTH = 110  # Characters per line (truncate longer lines)
     
-    def __init__(self, output_dir: str, hybrid_mode: bool = False):  # HYBRID_MODE_START
+    # Page geometry, computed once rather than per file
+    PAGE_TOP = letter[1] - MARGIN - FONT_SIZE  # Baseline of the first line on a page
+    PAGE_BOTTOM = MARGIN
+    LINES_PER_PAGE = int((PAGE_TOP - PAGE_BOTTOM) // LINE_HEIGHT) + 1
+    FILE_OVERHEAD_LINES = 6  # Separator + header, in line heights (page-limit estimate)
+    
+    # Read-ahead settings for concatenation (file I/O overlaps PDF rendering)
+    READ_WORKERS = 4
+    READ_AHEAD = 16
+    
+    # Bump when rendering changes in a way the layout constants above don't capture,
+    # so cached PDFs from earlier runs are no longer served
+    _CACHE_VERSION = 1
+    
+    # File types reformatted by _format_structured_data
+    _STRUCTURED = frozenset({'json', 'yaml', 'yml'})
+    
+    # Largest content (in characters) whose formatted output is memoized
+    FORMAT_CACHE_MAX_CHARS = 64 * 1024
+    
+    def __init__(self, output_dir: str, hybrid_mode: bool = False, cache_dir: Optional[str] = None):  # HYBRID_MODE_START
         """
         Initialize PDF converter.
         
         Args:
             output_dir: Directory to save PDF files
             hybrid_mode: Enable hybrid preprocessing for OCR-friendly transformation
+            cache_dir: Directory for caching generated PDFs across runs (None = no cache)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.hybrid_mode = hybrid_mode  # HYBRID_MODE_END
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.translation_dict_global = {}  # Accumulate translations across all files
         
-        self.conversion_stats = {
+        self.conversion_stats = self._empty_stats()
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        """Create a zeroed conversion statistics dictionary."""
+        return {
             'success': 0,
             'failed': 0,
             'total_size_original': 0,
             'total_size_pdf': 0,
+            'files_cached': 0,
             'errors': [],
         }
     
@@ -55,15 +143,25 @@ class PDFConverter:
         Returns:
             Path to generated PDF file, or None if conversion failed
         """
+        return self._convert_file_sized(file_info)[0]
+    
+    def _convert_file_sized(self, file_info: FileInfo) -> Tuple[Optional[Path], int]:
+        """
+        Convert a single file to PDF, also returning the size of the PDF written.
+        
+        Returns:
+            Tuple of (pdf_path, pdf_size_bytes); pdf_path is None if conversion failed
+        """
         try:
             # Read file content
             content = self._read_file(file_info)
             if content is None:
-                return None
+                return None, 0
             
             # HYBRID_MODE_START
             # Apply hybrid preprocessing if enabled
             is_first_file = not self.translation_dict_global  # Track if this is the first file processed
+            frontmatter = ''  # Rendered ahead of the content rather than concatenated onto it
             if self.hybrid_mode:
                 processed_content, translation_dict = preprocess_code(content, mode='hybrid')
                 # Accumulate translations for global dictionary
@@ -71,31 +169,32 @@ class PDFConverter:
                 content = processed_content
                 # Prepend translation dict to first file only
                 if is_first_file and self.translation_dict_global:
-                    content = prepend_dict(content, self.translation_dict_global)
+                    frontmatter = generate_translation_dict_yaml(self.translation_dict_global)
                     print(f"[HYBRID] Prepended translation dict to {file_info.relative_path} ({len(self.translation_dict_global)} mappings)")
                 elif translation_dict:
                     print(f"[HYBRID] Processed {file_info.relative_path}: {len(translation_dict)} symbol replacements")
             # HYBRID_MODE_END
             
-            # Format content based on file type
-            formatted_content = self._format_content(content, file_info.file_type)
+            # Format content based on file type (only JSON/YAML are reformatted)
+            file_type = file_info.file_type
+            formatted_content = self._format_structured_data(content, file_type) if file_type in self._STRUCTURED else content
             
             # Generate PDF
-            pdf_path = self._generate_pdf(file_info, formatted_content)
+            pdf_path, pdf_size = self._generate_pdf(file_info, formatted_content, frontmatter)
             
-            if pdf_path and pdf_path.exists():
+            if pdf_path:
                 # Update statistics
                 self.conversion_stats['success'] += 1
                 self.conversion_stats['total_size_original'] += file_info.size
-                self.conversion_stats['total_size_pdf'] += pdf_path.stat().st_size
-                return pdf_path
+                self.conversion_stats['total_size_pdf'] += pdf_size
+                return pdf_path, pdf_size
             else:
                 self.conversion_stats['failed'] += 1
                 self.conversion_stats['errors'].append({
                     'file': file_info.relative_path,
                     'error': 'PDF generation failed'
                 })
-                return None
+                return None, 0
         
         except Exception as e:
             self.conversion_stats['failed'] += 1
@@ -103,52 +202,90 @@ class PDFConverter:
                 'file': file_info.relative_path,
                 'error': str(e)
             })
-            return None
+            return None, 0
+    
+    def reset_stats(self) -> Dict[str, Any]:
+        """Start a fresh statistics window and return the previous statistics."""
+        previous = self.conversion_stats
+        self.conversion_stats = self._empty_stats()
+        return previous
+    
+    def merge_stats(self, stats: Dict[str, Any]) -> None:
+        """Fold conversion statistics from a worker converter into this one."""
+        for key in ('success', 'failed', 'total_size_original', 'total_size_pdf', 'files_cached'):
+            self.conversion_stats[key] += stats.get(key, 0)
+        self.conversion_stats['errors'].extend(stats.get('errors', []))
+        if stats.get('warnings'):
+            self.conversion_stats.setdefault('warnings', []).extend(stats['warnings'])
     
     def _read_file(self, file_info: FileInfo) -> Optional[str]:
         """Read file content with proper encoding handling."""
+        content, error = self._load_file(file_info)
+        if error:
+            self.conversion_stats['errors'].append(error)
+        return content
+    
+    def _load_file(self, file_info: FileInfo) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+        """
+        Read file content without touching shared state (safe to call from worker threads).
+        
+        Returns:
+            Tuple of (content, error_info); content is None when the file is skipped
+        """
         file_ext = Path(file_info.path).suffix.lower()
         
         # Handle .docx files (Microsoft Word documents)
         if file_ext == '.docx':
-            return self._read_docx(file_info)
+            return self._load_docx(file_info)
         
         # Handle regular text files
         try:
-            with open(file_info.path, 'r', encoding=file_info.encoding, errors='replace') as f:
-                return f.read()
+            # Unbuffered binary read: FileIO sizes the buffer from fstat and reads
+            # the whole file in one syscall instead of 8 KiB TextIOWrapper chunks
+            with open(file_info.path, 'rb', buffering=0) as f:
+                raw = f.read()
+            return self._decode_text(raw, file_info.encoding), None
         except UnicodeDecodeError:
-            # Try other common encodings
-            for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
+            # Try other common encodings on the bytes already read (latin-1 never fails)
+            for encoding in ['cp1252', 'latin-1']:
                 try:
-                    with open(file_info.path, 'r', encoding=encoding, errors='replace') as f:
-                        return f.read()
+                    return self._decode_text(raw, encoding), None
                 except (UnicodeDecodeError, LookupError):
                     continue
             
             # If all else fails, skip the file
-            self.conversion_stats['errors'].append({
+            return None, {
                 'file': file_info.relative_path,
                 'error': 'Could not decode file encoding'
-            })
-            return None
+            }
         except Exception as e:
-            self.conversion_stats['errors'].append({
+            return None, {
                 'file': file_info.relative_path,
                 'error': f'File read error: {str(e)}'
-            })
-            return None
+            }
     
-    def _read_docx(self, file_info: FileInfo) -> Optional[str]:
+    @staticmethod
+    def _decode_text(raw: bytes, encoding: str) -> str:
+        """
+        Decode file bytes, normalizing newlines the way text-mode open() does.
+        
+        Decoding is strict so a wrong guess raises UnicodeDecodeError and the caller
+        can fall back, instead of silently producing U+FFFD replacement characters.
+        """
+        text = raw.decode(encoding)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def _load_docx(self, file_info: FileInfo) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
         """Extract text from .docx files."""
         try:
             from docx import Document
         except ImportError:
-            self.conversion_stats['errors'].append({
+            return None, {
                 'file': file_info.relative_path,
                 'error': 'python-docx library not installed. Install with: pip install python-docx'
-            })
-            return None
+            }
         
         try:
             doc = Document(file_info.path)
@@ -161,29 +298,83 @@ class PDFConverter:
                         paragraphs.append(cell.text)
             
             content = '\n\n'.join(paragraphs)
-            return content if content.strip() else None
+            return (content if content.strip() else None), None
         except Exception as e:
-            self.conversion_stats['errors'].append({
+            return None, {
                 'file': file_info.relative_path,
                 'error': f'Failed to extract text from .docx: {str(e)}'
-            })
-            return None
+            }
     
-    def _format_content(self, content: str, file_type: str) -> str:
-        """Format content based on file type."""
-        if file_type in ('json', 'yaml', 'yml'):
-            return self._format_structured_data(content, file_type)
-        else:
-            return content
+    def _load_prepared(self, file_info: FileInfo) -> Tuple[Optional[str], Optional[Dict[str, str]], Dict[str, str]]:
+        """
+        Read a file and, in hybrid mode, preprocess it (pure; safe in worker threads).
+        
+        Returns:
+            Tuple of (content, error_info, translation_dict)
+        """
+        content, error = self._load_file(file_info)
+        translation_dict = {}
+        if content is not None and self.hybrid_mode:  # HYBRID_MODE_START
+            content, translation_dict = preprocess_code(content, mode='hybrid')  # HYBRID_MODE_END
+        return content, error, translation_dict
     
-    def _format_structured_data(self, content: str, file_type: str) -> str:
-        """Format JSON/YAML with proper indentation."""
+    def _prefetch_files(self, files: List[FileInfo]) -> Iterator[Tuple[FileInfo, Future]]:
+        """
+        Yield (file_info, future) pairs in order while reading ahead on a thread pool.
+        
+        File reads release the GIL, so the next files load while the caller renders.
+        At most READ_AHEAD reads are in flight; futures resolve to _load_prepared results.
+        """
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as executor:
+            for file_info in files:
+                pending.append((file_info, executor.submit(self._load_prepared, file_info)))
+                if len(pending) >= self.READ_AHEAD:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+    
+    @classmethod
+    def _format_structured_data(cls, content: str, file_type: str) -> str:
+        """
+        Format JSON/YAML with proper indentation.
+        
+        Small files are memoized on the content itself: identical config files
+        (tsconfig.json, CI workflows) recur across packages and re-parsing them is
+        pure overhead. Content over FORMAT_CACHE_MAX_CHARS (lockfiles, large fixtures)
+        rarely repeats, so it is formatted uncached instead of pinning the input and
+        output in every worker's cache.
+        """
+        if len(content) <= cls.FORMAT_CACHE_MAX_CHARS:
+            return cls._format_structured_cached(content, file_type)
+        return cls._format_structured(content, file_type)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _format_structured_cached(content: str, file_type: str) -> str:
+        """Memoized _format_structured for content within FORMAT_CACHE_MAX_CHARS."""
+        return PDFConverter._format_structured(content, file_type)
+    
+    @staticmethod
+    def _format_structured(content: str, file_type: str) -> str:
+        """Reformat JSON/YAML content, returning it unchanged if it does not parse."""
         try:
             if file_type == 'json':
+                if orjson is not None:
+                    try:
+                        data = orjson.loads(content)
+                    except (ValueError, TypeError):
+                        pass  # NaN, Infinity, etc.: let the stdlib decide
+                    else:
+                        # orjson reads integers wider than 64 bits as floats and writes floats
+                        # differently from the stdlib (1e20 vs 1e+20), so documents holding
+                        # any float go through json for exact, machine-independent output
+                        if not _has_float(data):
+                            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
                 data = json.loads(content)
                 return json.dumps(data, indent=2, ensure_ascii=False)
             elif file_type in ('yaml', 'yml'):
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YAML_LOADER)
                 return yaml.dump(data, indent=2, default_flow_style=False, allow_unicode=True)
         except Exception:
             # If parsing fails, return original content
@@ -191,8 +382,13 @@ class PDFConverter:
         
         return content
     
-    def _generate_pdf(self, file_info: FileInfo, content: str) -> Optional[Path]:
-        """Generate PDF file with dense layout."""
+    def _generate_pdf(self, file_info: FileInfo, content: str, frontmatter: str = '') -> Tuple[Optional[Path], int]:
+        """
+        Generate PDF file with dense layout.
+        
+        Returns:
+            Tuple of (pdf_path, pdf_size_bytes); pdf_path is None if generation failed
+        """
         # Create output filename (preserve relative path structure)
         relative_path = Path(file_info.relative_path)
         pdf_filename = relative_path.with_suffix('.pdf')
@@ -202,101 +398,137 @@ class PDFConverter:
         pdf_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            # Use SimpleDocTemplate for better control
-            doc = SimpleDocTemplate(
-                str(pdf_path),
-                pagesize=letter,
-                leftMargin=self.MARGIN,
-                rightMargin=self.MARGIN,
-                topMargin=self.MARGIN,
-                bottomMargin=self.MARGIN,
-            )
-            
-            # Build PDF content
-            story = []
+            # Unchanged files render to identical bytes: reuse them from the cache
+            cache_path = self._get_cache_path(file_info, content, frontmatter)
+            if cache_path and cache_path.exists():
+                data = cache_path.read_bytes()
+                pdf_path.write_bytes(data)
+                self.conversion_stats['files_cached'] += 1
+                return pdf_path, len(data)
             
-            # Add file header
-            styles = getSampleStyleSheet()
-            header_style = styles['Heading2']
-            header_style.fontSize = 10
-            header_style.leading = 12
-            
-            story.append(Paragraph(f"<b>File:</b> {file_info.relative_path}", header_style))
-            story.append(Paragraph(f"<b>Type:</b> {file_info.file_type} | <b>Size:</b> {file_info.size} bytes", styles['Normal']))
-            story.append(Spacer(1, 6))
-            
-            # Add content as preformatted text (preserves formatting)
-            # Use Code style with monospace font
-            code_style = styles['Code']
-            code_style.fontSize = self.FONT_SIZE
-            code_style.leading = self.LINE_HEIGHT
-            code_style.fontName = 'Courier'
-            
-            lines = content.split('\n')
-            for line in lines:
-                # Truncate very long lines
-                if len(line) > self.MAX_LINE_LENGTH:
-                    line = line[:self.MAX_LINE_LENGTH] + '...'
-                
-                # Escape XML/HTML special characters for reportlab Paragraph parser
-                # reportlab uses XML-like markup, so we must escape <, >, and &
-                # First preserve any existing HTML entities by replacing them with placeholders
-                line = line.replace('&nbsp;', '__NBSP__').replace('&lt;', '__LT__').replace('&gt;', '__GT__').replace('&amp;', '__AMP__')
-                # Now escape all remaining &, <, > characters
-                escaped_line = html.escape(line)
-                # Restore preserved entities
-                escaped_line = escaped_line.replace('__NBSP__', '&nbsp;').replace('__LT__', '&lt;').replace('__GT__', '&gt;').replace('__AMP__', '&amp;')
-                # Replace spaces with non-breaking spaces for better formatting
-                escaped_line = escaped_line.replace(' ', '&nbsp;')
-                
-                # Use Paragraph with Code style to preserve formatting
-                story.append(Paragraph(escaped_line, code_style))
-            
-            # Build PDF
-            doc.build(story)
-            
-            return pdf_path
+            # Draw straight onto a canvas: for monospaced, pre-truncated code the Platypus
+            # machinery (markup parsing, wrapping, flowable layout) costs far more and adds nothing
+            return self._generate_pdf_simple(file_info, content, pdf_path, frontmatter, cache_path)
+        except Exception as e:
+            self.conversion_stats['errors'].append({
+                'file': file_info.relative_path,
+                'error': f'PDF generation error: {str(e)}'
+            })
+            return None, 0
+    
+    def _get_cache_path(self, file_info: FileInfo, content: str, frontmatter: str) -> Optional[Path]:
+        """
+        Get cache path for a rendered PDF.
         
-        except Exception:
-            # Fallback to simpler canvas-based approach if SimpleDocTemplate fails
-            try:
-                return self._generate_pdf_simple(file_info, content, pdf_path)
-            except Exception as e2:
-                self.conversion_stats['errors'].append({
-                    'file': file_info.relative_path,
-                    'error': f'PDF generation error: {str(e2)}'
-                })
-                return None
+        Keyed on everything that reaches the page (header fields, frontmatter and
+        formatted content), so hybrid mode and formatting changes never hit stale entries,
+        and salted with the layout settings, renderer version and _CACHE_VERSION, so
+        entries written by a different layout are never reused.
+        """
+        if not self.cache_dir:
+            return None
+        
+        key = hashlib.blake2b(digest_size=16)
+        key.update(
+            f"{self._CACHE_VERSION}\0{REPORTLAB_VERSION}\0{self.FONT_SIZE}\0{self.LINE_HEIGHT}\0"
+            f"{self.MARGIN}\0{self.MAX_LINE_LENGTH}\0".encode('utf-8')
+        )
+        key.update(f"{file_info.relative_path}\0{file_info.file_type}\0{file_info.size}\0".encode('utf-8'))
+        key.update(frontmatter.encode('utf-8', 'surrogatepass'))
+        key.update(b'\0')
+        key.update(content.encode('utf-8', 'surrogatepass'))
+        return self.cache_dir / f"{key.hexdigest()}.pdf"
     
-    def _generate_pdf_simple(self, file_info: FileInfo, content: str, pdf_path: Path) -> Path:
-        """Fallback simple PDF generation using canvas."""
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
+    def _new_canvas(self, pdf_path: Path) -> canvas.Canvas:
+        """Open a Courier canvas; content streams are compressed as each page closes."""
+        c = canvas.Canvas(str(pdf_path), pagesize=letter, pageCompression=1)
         c.setFont("Courier", self.FONT_SIZE)
+        return c
+    
+    @staticmethod
+    def _save_canvas(c: canvas.Canvas, pdf_path: Path, cache_path: Optional[Path] = None) -> int:
+        """Write the finished canvas to disk (and the cache) and return the PDF size without a stat() call."""
+        data = c.getpdfdata()  # Closes the last page, same as save()
+        pdf_path.write_bytes(data)
+        if cache_path:
+            # Write-then-rename so concurrent workers never read a partial entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, cache_path)
+        return len(data)
+    
+    def _draw_file(self, c: canvas.Canvas, file_info: FileInfo, lines: List[str], y_pos: float) -> float:
+        """
+        Draw a file header and its lines onto the canvas, starting new pages as needed.
+        
+        Args:
+            c: Canvas to draw on
+            file_info: FileInfo for the header
+            lines: Content lines (frontmatter included)
+            y_pos: Current vertical position on the page
+            
+        Returns:
+            Vertical position after the last drawn line
+        """
+        # Keep the two header lines together on one page
+        if y_pos - self.LINE_HEIGHT * 1.5 < self.PAGE_BOTTOM:
+            c.showPage()
+            c.setFont("Courier", self.FONT_SIZE)
+            y_pos = self.PAGE_TOP
         
         # Add header
-        y_pos = 750
         c.drawString(self.MARGIN, y_pos, f"File: {file_info.relative_path}")
         y_pos -= self.LINE_HEIGHT * 1.5
         c.drawString(self.MARGIN, y_pos, f"Type: {file_info.file_type} | Size: {file_info.size} bytes")
         y_pos -= self.LINE_HEIGHT * 2
         
-        # Add content
-        lines = content.split('\n')
-        for line in lines:
-            if y_pos < 50:
-                c.showPage()
-                c.setFont("Courier", self.FONT_SIZE)
-                y_pos = 750
-            
-            # Truncate long lines
-            if len(line) > self.MAX_LINE_LENGTH:
-                line = line[:self.MAX_LINE_LENGTH] + '...'
-            
-            c.drawString(self.MARGIN, y_pos, line)
-            y_pos -= self.LINE_HEIGHT
+        # Add content through one text object per page: a single BT...ET block whose
+        # lines advance by the leading, instead of a positioned text block per line
+        # (attribute lookups hoisted out of the per-line loop)
+        margin = self.MARGIN
+        line_height = self.LINE_HEIGHT
+        page_top = self.PAGE_TOP
+        page_bottom = self.PAGE_BOTTOM
+        max_len = self.MAX_LINE_LENGTH
+        tx = self._begin_text(c, y_pos)
+        text_line = tx.textLine
+        with _gc_paused():
+            for line in lines:
+                if y_pos < page_bottom:
+                    c.drawText(tx)
+                    c.showPage()
+                    c.setFont("Courier", self.FONT_SIZE)
+                    y_pos = page_top
+                    tx = self._begin_text(c, y_pos)
+                    text_line = tx.textLine
+                
+                # Truncate long lines
+                text_line(line[:max_len] + '...' if len(line) > max_len else line)
+                y_pos -= line_height
+        c.drawText(tx)
         
-        c.save()
-        return pdf_path
+        return y_pos
+    
+    def _begin_text(self, c: canvas.Canvas, y_pos: float):
+        """Start a Courier text object at the left margin with one-line leading."""
+        tx = c.beginText(self.MARGIN, y_pos)
+        tx.setFont("Courier", self.FONT_SIZE, self.LINE_HEIGHT)
+        return tx
+    
+    def _generate_pdf_simple(
+        self,
+        file_info: FileInfo,
+        content: str,
+        pdf_path: Path,
+        frontmatter: str = '',
+        cache_path: Optional[Path] = None,
+    ) -> Tuple[Path, int]:
+        """Render a file onto a canvas line by line in Courier; returns (pdf_path, pdf_size)."""
+        c = self._new_canvas(pdf_path)
+        lines = frontmatter.splitlines() + content.split('\n')
+        self._draw_file(c, file_info, lines, self.PAGE_TOP)
+        return pdf_path, self._save_canvas(c, pdf_path, cache_path)
     
     def concatenate_files_to_pdf(
         self, 
@@ -317,118 +549,140 @@ class PDFConverter:
         Returns:
             Path to generated PDF, or None if failed
         """
+        pdf_path, _, _, overflow = self._concatenate_files_sized(files, pdf_name, max_pages, max_size_bytes)
+        if pdf_path and overflow:
+            self.conversion_stats.setdefault('warnings', []).append({
+                'pdf': pdf_name,
+                'message': f'{len(overflow)} files left out by the page or size limit',
+            })
+        return pdf_path
+    
+    def concatenate_files_to_pdfs(
+        self,
+        files: List[FileInfo],
+        pdf_name: str,
+        max_pages: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+    ) -> List[Tuple[Path, int, List[FileInfo]]]:
+        """
+        Concatenate files into as many PDFs as the limits require.
+        
+        Files that would push a PDF past max_pages or max_size_bytes go into
+        pdf_name_part2, pdf_name_part3, ... instead of being dropped.
+        
+        Returns:
+            List of (pdf_path, pdf_size_bytes, included_files) per PDF written; stops at
+            the first PDF that fails
+        """
+        parts = []
+        remaining = files
+        while remaining:
+            part_name = f"{pdf_name}_part{len(parts) + 1}" if parts else pdf_name
+            pdf_path, pdf_size, included, remaining = self._concatenate_files_sized(
+                remaining, part_name, max_pages, max_size_bytes,
+            )
+            if pdf_path is None:
+                break
+            parts.append((pdf_path, pdf_size, included))
+        return parts
+    
+    def _concatenate_files_sized(
+        self,
+        files: List[FileInfo],
+        pdf_name: str,
+        max_pages: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+    ) -> Tuple[Optional[Path], int, List[FileInfo], List[FileInfo]]:
+        """
+        Concatenate files into one PDF, also returning the size of the PDF written.
+        
+        Returns:
+            Tuple of (pdf_path, pdf_size_bytes, included_files, overflow_files); pdf_path
+            is None if concatenation failed. Overflow files were left out by the page or
+            size limit; unreadable files are in neither list.
+        """
         pdf_path = self.output_dir / f"{pdf_name}.pdf"
         
         try:
-            doc = SimpleDocTemplate(
-                str(pdf_path),
-                pagesize=letter,
-                leftMargin=self.MARGIN,
-                rightMargin=self.MARGIN,
-                topMargin=self.MARGIN,
-                bottomMargin=self.MARGIN,
-            )
-            
-            story = []
-            styles = getSampleStyleSheet()
-            header_style = styles['Heading2']
-            header_style.fontSize = 10
-            header_style.leading = 12
-            
-            code_style = styles['Code']
-            code_style.fontSize = self.FONT_SIZE
-            code_style.leading = self.LINE_HEIGHT
-            code_style.fontName = 'Courier'
+            # Draw each file as soon as it is read: no flowable story is built, so
+            # memory holds one file plus the finished page streams rather than a
+            # Paragraph tree for the whole group
+            c = self._new_canvas(pdf_path)
+            y_pos = self.PAGE_TOP
             
             # Sort files alphabetically for consistency
             sorted_files = sorted(files, key=lambda f: f.relative_path)
             
             total_size_original = 0
-            files_included = 0
-            files_skipped_size_limit = 0
+            included: List[FileInfo] = []
+            overflow: List[FileInfo] = []
             is_first_file = True  # HYBRID_MODE_START - track first file for dict prepending
             
-            for file_info in sorted_files:
+            for file_info, read_future in self._prefetch_files(sorted_files):
                 # Check size limit - only enforce if we've already included at least one file
                 # This ensures every PDF group gets at least one file
-                if max_size_bytes and files_included > 0:
+                if max_size_bytes and included:
                     if (total_size_original + file_info.size) > max_size_bytes:
-                        files_skipped_size_limit += 1
-                        continue  # Skip this file, try next one
+                        overflow.append(file_info)
+                        continue  # Leave this file for the next PDF, try next one
                 
-                # Read file content
-                content = self._read_file(file_info)
+                # Read file content (prefetched and, in hybrid mode, already preprocessed;
+                # errors only count for files actually used)
+                content, read_error, translation_dict = read_future.result()
+                if read_error:
+                    self.conversion_stats['errors'].append(read_error)
                 if content is None:
                     continue
                 
                 # HYBRID_MODE_START
-                # Apply hybrid preprocessing if enabled
+                # Merge this file's translations (preprocessing ran in the read-ahead workers)
+                frontmatter = ''  # Rendered ahead of the content rather than concatenated onto it
                 if self.hybrid_mode:
-                    processed_content, translation_dict = preprocess_code(content, mode='hybrid')
                     # Accumulate translations for global dictionary
                     self.translation_dict_global.update(translation_dict)
-                    content = processed_content
                     # Prepend translation dict to first file only
                     if is_first_file and self.translation_dict_global:
-                        content = prepend_dict(content, self.translation_dict_global)
+                        frontmatter = generate_translation_dict_yaml(self.translation_dict_global)
                         is_first_file = False
                         print(f"[HYBRID] Prepended translation dict to {file_info.relative_path} ({len(self.translation_dict_global)} mappings)")
                     elif translation_dict:
                         print(f"[HYBRID] Processed {file_info.relative_path}: {len(translation_dict)} symbol replacements")
                 # HYBRID_MODE_END
                 
-                # Format content
-                formatted_content = self._format_content(content, file_info.file_type)
+                # Format content (only JSON/YAML are reformatted)
+                file_type = file_info.file_type
+                formatted_content = self._format_structured_data(content, file_type) if file_type in self._STRUCTURED else content
+                
+                lines = frontmatter.splitlines() + formatted_content.split('\n')
                 
-                # Add file separator
-                story.append(Spacer(1, 12))
-                story.append(Paragraph(
-                    f"<b>File:</b> {file_info.relative_path}", 
-                    header_style
-                ))
-                story.append(Paragraph(
-                    f"<b>Type:</b> {file_info.file_type} | <b>Size:</b> {file_info.size} bytes", 
-                    styles['Normal']
-                ))
-                story.append(Spacer(1, 6))
+                # Check page limit before drawing so the PDF never overflows it
+                # (same rule as the size limit: the first file is always included)
+                if max_pages and included:
+                    if self._estimate_pages(c, y_pos, len(lines)) > max_pages:
+                        overflow.append(file_info)
+                        if frontmatter:
+                            is_first_file = True  # Hand the translation dict to the next file
+                        continue
+                
+                # Add file separator (blank line between files)
+                if included:
+                    y_pos -= self.LINE_HEIGHT * 2
                 
                 # Add file content
-                lines = formatted_content.split('\n')
-                for line in lines:
-                    if len(line) > self.MAX_LINE_LENGTH:
-                        line = line[:self.MAX_LINE_LENGTH] + '...'
-                    
-                    # Escape XML/HTML special characters for reportlab Paragraph parser
-                    # reportlab uses XML-like markup, so we must escape <, >, and &
-                    escaped_line = html.escape(line)
-                    # Replace spaces with non-breaking spaces for better formatting
-                    escaped_line = escaped_line.replace(' ', '&nbsp;')
-                    
-                    story.append(Paragraph(escaped_line, code_style))
+                y_pos = self._draw_file(c, file_info, lines, y_pos)
                 
                 total_size_original += file_info.size
-                files_included += 1
+                included.append(file_info)
             
-            # Build PDF
-            doc.build(story)
+            # Finish the last page and write the PDF
+            pdf_size = self._save_canvas(c, pdf_path)
             
             # Update stats
-            if pdf_path.exists():
-                pdf_size = pdf_path.stat().st_size
-                self.conversion_stats['success'] += files_included
-                self.conversion_stats['total_size_original'] += total_size_original
-                self.conversion_stats['total_size_pdf'] += pdf_size
-                
-                # Track files skipped due to size limit (informational only; not an error)
-                if files_skipped_size_limit > 0:
-                    self.conversion_stats.setdefault('warnings', []).append({
-                        'pdf': pdf_name,
-                        'message': f'{files_skipped_size_limit} files skipped due to size limit ({max_size_bytes / (1024*1024):.1f} MB)'
-                    })
-                
-                return pdf_path
+            self.conversion_stats['success'] += len(included)
+            self.conversion_stats['total_size_original'] += total_size_original
+            self.conversion_stats['total_size_pdf'] += pdf_size
             
-            return None
+            return pdf_path, pdf_size, included, overflow
             
         except Exception as e:
             self.conversion_stats['failed'] += len(files)
@@ -436,7 +690,13 @@ class PDFConverter:
                 'files': [f.relative_path for f in files],
                 'error': str(e)
             })
-            return None
+            return None, 0, [], []
+    
+    def _estimate_pages(self, c: canvas.Canvas, y_pos: float, line_count: int) -> int:
+        """Estimate the page count after drawing a file of line_count lines at y_pos."""
+        remaining = int((y_pos - self.PAGE_BOTTOM) // self.LINE_HEIGHT) + 1 if y_pos >= self.PAGE_BOTTOM else 0
+        overflow = line_count + self.FILE_OVERHEAD_LINES - remaining
+        return c.getPageNumber() + max(0, math.ceil(overflow / self.LINES_PER_PAGE))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get conversion statistics."""
@@ -456,3 +716,15 @@ class PDFConverter:
             ) * 100,
         }
 
+
+def _concatenate_worker(
+    output_dir: str,
+    files: List[FileInfo],
+    pdf_name: str,
+    max_pages: Optional[int],
+    max_size_bytes: Optional[int],
+) -> Tuple[List[Tuple[Path, int, List[FileInfo]]], Dict[str, Any]]:
+    """Concatenate one smart-concatenation group in a worker process; returns its PDF parts and stats."""
+    converter = PDFConverter(output_dir)
+    parts = converter.concatenate_files_to_pdfs(files, pdf_name, max_pages, max_size_bytes)
+    return parts, converter.conversion_stats
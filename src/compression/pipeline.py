@@ -1,27 +1,47 @@
 """Main compression pipeline orchestrator with enhanced batch processing."""
 
+import heapq
 import json
+import os
 import signal
+import sys
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable, Set
+from typing import List, Optional, Dict, Any, Callable, Iterator, Set, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 from multiprocessing import cpu_count
-import time
 
 try:
-    from tqdm import tqdm
+    import orjson
 except ImportError:
-    tqdm = None
+    orjson = None
 
 from ..utils.file_discovery import FileDiscovery, FileInfo
 from ..utils.metrics import CompressionMetrics
 from ..utils.telemetry import TelemetryLogger
-from .pdf_converter import PDFConverter
+from .pdf_converter import PDFConverter, _concatenate_worker, enable_gc_pause
+
+# Executor override for parallel runs: thread, process or auto
+POOL_ENV_FLAG = 'SAKURA_POOL'
+POOL_TYPES = ('auto', 'process', 'thread')
 
 
 class CompressionPipeline:
-    """Orchestrates the complete compression pipeline with enhanced batch processing."""
+    """
+    Orchestrates the complete compression pipeline with enhanced batch processing.
+    
+    With parallel=True, work runs in spawned worker processes unless pool_type or the
+    SAKURA_POOL environment variable selects threads. Spawned workers re-import the
+    caller's __main__ module, so scripts must guard the pipeline call with
+    ``if __name__ == "__main__":``. If the workers can't start, the remaining work
+    reruns on a thread pool.
+    """
+    
+    # Parallel runs keep at most this many chunks queued or running per worker
+    IN_FLIGHT_PER_WORKER = 2
     
     def __init__(
         self,
@@ -36,6 +56,9 @@ class CompressionPipeline:
         retry_count: int = 3,
         retry_delay: float = 1.0,
         hybrid_mode: bool = False,  # HYBRID_MODE_START
+        pool_type: str = 'auto',
+        incremental: bool = False,
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize compression pipeline.
@@ -51,21 +74,38 @@ class CompressionPipeline:
             checkpoint_file: Path to checkpoint file for state saving
             retry_count: Number of retries for failed files
             retry_delay: Delay between retries in seconds
+            pool_type: Parallel executor: 'process', 'thread', or 'auto' (SAKURA_POOL, then
+                threads on free-threaded Python builds and processes otherwise)
+            incremental: Skip files whose size and modification time match the manifest
+                from the previous run and whose PDF is still present
+            cache_dir: Directory for caching generated PDFs across runs (None = no cache)
         """
+        if pool_type not in POOL_TYPES:
+            raise ValueError(f"Invalid pool_type: {pool_type}. Must be one of {', '.join(POOL_TYPES)}")
+        
         self.source_dir = Path(source_dir)
         self.output_dir = Path(output_dir)
+        # Reports expose only basenames; computed once rather than per report
+        self._source_basename = self._sanitize_path(self.source_dir)
+        self._output_basename = self._sanitize_path(self.output_dir)
         self.exclusions = exclusions or set()
         self.parallel = parallel
         self.max_workers = max_workers or (cpu_count() - 1 or 1)
+        self.autotune_workers = max_workers is None  # Refined per run by _autotune_workers
         self.hybrid_mode = hybrid_mode  # HYBRID_MODE_START
         self.batch_size = batch_size
         self.resume = resume
         self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else self.output_dir / '.compression_checkpoint.json'
+        self.checkpoint_log = self.checkpoint_file.with_suffix('.jsonl')  # Per-batch progress, appended
         self.retry_count = retry_count
         self.retry_delay = retry_delay
+        self.pool_type = pool_type
+        self.incremental = incremental
+        self.manifest_file = self.output_dir / '.compression_manifest.json'
+        self.cache_dir = str(cache_dir) if cache_dir else None  # Passed as-is to worker processes
         
         self.discovery = FileDiscovery(str(self.source_dir), self.exclusions)
-        self.converter = PDFConverter(str(self.output_dir), hybrid_mode=hybrid_mode)  # HYBRID_MODE_START
+        self.converter = PDFConverter(str(self.output_dir), hybrid_mode=hybrid_mode, cache_dir=self.cache_dir)  # HYBRID_MODE_START
         self.metrics = CompressionMetrics()
         self.telemetry = TelemetryLogger(self.output_dir)
         self.failure_report_path = self.output_dir / 'failed_files.json'
@@ -73,8 +113,11 @@ class CompressionPipeline:
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
         self.processed_files: set = set()
+        self.pdf_sizes: Dict[str, int] = {}  # Source relative path -> size of the PDF written this run
         self.failed_files: List[Dict[str, Any]] = []
-        self.cancelled = False
+        # Set on cancellation; retry backoff waits on it so shutdown is not held up by sleeps
+        self._cancel_event = threading.Event()
+        self._worker_cancel_event = None  # Shared with worker processes while a process pool runs
         
         # Setup signal handler for graceful shutdown (only in main thread)
         try:
@@ -85,25 +128,80 @@ class CompressionPipeline:
             # This is expected when running in background threads
             pass
     
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._cancel_event.is_set()
+    
+    @cancelled.setter
+    def cancelled(self, value: bool):
+        events = [self._cancel_event]
+        if self._worker_cancel_event is not None:
+            events.append(self._worker_cancel_event)
+        for event in events:
+            if value:
+                event.set()
+            else:
+                event.clear()
+    
     def _signal_handler(self, signum, frame):
         """Handle cancellation signals gracefully."""
         self.cancelled = True
         print("\n\nCancellation requested. Finishing current batch and saving checkpoint...")
     
     def _load_checkpoint(self) -> Dict[str, Any]:
-        """Load checkpoint state if it exists."""
-        if not self.checkpoint_file.exists():
-            return {'processed_files': [], 'failed_files': []}
+        """Load checkpoint state: the last snapshot plus any progress appended since."""
+        checkpoint = {'processed_files': [], 'failed_files': []}
+        
+        if self.checkpoint_file.exists():
+            try:
+                checkpoint = _read_json(self.checkpoint_file)
+            except Exception as e:
+                print(f"Warning: Could not load checkpoint: {e}")
+        
+        if self.checkpoint_log.exists():
+            processed = checkpoint.setdefault('processed_files', [])
+            failed = checkpoint.setdefault('failed_files', [])
+            try:
+                with open(self.checkpoint_log, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = _loads(line)
+                        except ValueError:
+                            continue  # Torn final line from an interrupted write
+                        if 'processed' in entry:
+                            processed.append(entry['processed'])
+                        elif 'failed' in entry:
+                            failed.append(entry['failed'])
+            except Exception as e:
+                print(f"Warning: Could not load checkpoint log: {e}")
         
+        return checkpoint
+    
+    def _save_checkpoint_batch(self, new_processed: List[str], new_failed: List[Dict]):
+        """Append one batch of progress to the checkpoint log (O(batch), not O(run))."""
+        if not new_processed and not new_failed:
+            return
         try:
-            with open(self.checkpoint_file, 'r') as f:
-                return json.load(f)
+            lines = [_dumps({'processed': path}) for path in new_processed]
+            lines += [_dumps({'failed': failure}) for failure in new_failed]
+            with open(self.checkpoint_log, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
         except Exception as e:
-            print(f"Warning: Could not load checkpoint: {e}")
-            return {'processed_files': [], 'failed_files': []}
+            print(f"Warning: Could not save checkpoint: {e}")
+    
+    def _reset_checkpoint(self):
+        """Discard checkpoint state from a previous run."""
+        for path in (self.checkpoint_file, self.checkpoint_log):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Warning: Could not reset checkpoint: {e}")
     
     def _save_checkpoint(self, processed_files: set, failed_files: List[Dict]):
-        """Save checkpoint state."""
+        """Save a consolidated checkpoint snapshot and drop the now-redundant log."""
         try:
             checkpoint_data = {
                 'processed_files': list(processed_files),
@@ -112,32 +210,61 @@ class CompressionPipeline:
                 'source_dir': str(self.source_dir),
                 'output_dir': str(self.output_dir),
             }
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
+            _write_json(self.checkpoint_file, checkpoint_data, indent=True)
+            if self.checkpoint_log.exists():
+                self.checkpoint_log.unlink()
         except Exception as e:
             print(f"Warning: Could not save checkpoint: {e}")
     
-    def _convert_file_with_retry(self, file_info: FileInfo) -> tuple[Optional[Path], Optional[str]]:
-        """Convert a file with retry logic."""
-        last_error = None
-        
-        for attempt in range(self.retry_count):
-            if self.cancelled:
-                return None, "Cancelled"
-            
-            try:
-                pdf_path = self.converter.convert_file(file_info)
-                if pdf_path:
-                    return pdf_path, None
-                else:
-                    last_error = "PDF generation returned None"
-            except Exception as e:
-                last_error = str(e)
-            
-            if attempt < self.retry_count - 1:
-                time.sleep(self.retry_delay * (attempt + 1))  # Exponential backoff
-        
-        return None, last_error
+    def _load_manifest(self) -> Dict[str, List[int]]:
+        """Load the source manifest: relative path -> [size, mtime_ns] as of the last run."""
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            return _read_json(self.manifest_file).get('files', {})
+        except Exception as e:
+            print(f"Warning: Could not load manifest: {e}")
+            return {}
+    
+    def _save_manifest(self, files: List[FileInfo]):
+        """Record size and modification time for every file that has an up-to-date PDF."""
+        try:
+            manifest = {
+                'files': {
+                    f.relative_path: [f.size, f.mtime_ns]
+                    for f in files
+                    if f.relative_path in self.processed_files
+                },
+                'timestamp': datetime.now().isoformat(),
+            }
+            _write_json(self.manifest_file, manifest)
+        except Exception as e:
+            print(f"Warning: Could not save manifest: {e}")
+    
+    def _find_unchanged(self, files: List[FileInfo]) -> Set[str]:
+        """Relative paths whose source is unchanged since the manifest and whose PDF exists."""
+        manifest = self._load_manifest()
+        if not manifest:
+            return set()
+        return {
+            f.relative_path
+            for f in files
+            if manifest.get(f.relative_path) == [f.size, f.mtime_ns]
+            and (self.output_dir / Path(f.relative_path).with_suffix('.pdf')).is_file()
+        }
+    
+    def _pending_files(self, files: List[FileInfo]) -> List[FileInfo]:
+        """Files not yet processed (by a resumed checkpoint or incremental manifest)."""
+        processed = self.processed_files
+        if not processed:
+            return files  # Fresh run: nothing to filter
+        return [f for f in files if f.relative_path not in processed]
+    
+    def _convert_file_with_retry(self, file_info: FileInfo) -> tuple[Optional[Path], int, Optional[str]]:
+        """Convert a file with retry logic; returns (pdf_path, pdf_size, error)."""
+        return _convert_with_retry(
+            self.converter, file_info, self.retry_count, self.retry_delay, self._cancel_event
+        )
     
     def _process_file_batch(self, files: List[FileInfo], progress_callback: Optional[Callable] = None) -> tuple[int, int, List[Dict]]:
         """Process a batch of files."""
@@ -145,25 +272,33 @@ class CompressionPipeline:
         failed = 0
         errors = []
         
+        # Hoist per-file lookups out of the loop
+        is_cancelled = self._cancel_event.is_set
+        processed = self.processed_files
+        pdf_sizes = self.pdf_sizes
+        attempts = self.retry_count
+        
         for file_info in files:
-            if self.cancelled:
+            if is_cancelled():
                 break
             
-            # Check if already processed (resume mode)
-            if self.resume and file_info.relative_path in self.processed_files:
+            # Check if already processed (resume or incremental mode)
+            relative_path = file_info.relative_path
+            if relative_path in processed:
                 continue
             
-            pdf_path, error = self._convert_file_with_retry(file_info)
+            pdf_path, pdf_size, error = self._convert_file_with_retry(file_info)
             
             if pdf_path:
                 converted += 1
-                self.processed_files.add(file_info.relative_path)
+                processed.add(relative_path)
+                pdf_sizes[relative_path] = pdf_size
             else:
                 failed += 1
                 error_info = {
-                    'file': file_info.relative_path,
+                    'file': relative_path,
                     'error': error or 'Unknown error',
-                    'attempts': self.retry_count,
+                    'attempts': attempts,
                 }
                 errors.append(error_info)
                 self.failed_files.append(error_info)
@@ -173,24 +308,101 @@ class CompressionPipeline:
         
         return converted, failed, errors
     
+    def _resolve_pool_type(self) -> str:
+        """Resolve 'auto' to 'process' or 'thread' for this interpreter."""
+        pool_type = self.pool_type
+        if pool_type == 'auto':
+            env_value = os.getenv(POOL_ENV_FLAG, '').strip().lower()
+            if env_value in ('process', 'thread'):
+                return env_value
+            # Free-threaded (PEP 703) builds scale CPU-bound threads without pickling costs
+            gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+            pool_type = 'process' if gil_enabled else 'thread'
+        return pool_type
+    
+    def _autotune_workers(self, file_count: int) -> int:
+        """
+        Pick a worker count for this run when none was requested.
+        
+        Process pools gain little past ~8 workers for rendering and SMT siblings
+        oversubscribe; thread pools share the GIL-bound interpreter with file I/O, so
+        they get half the cores. Never more workers than there are batches to run.
+        """
+        cores = cpu_count()
+        if self._resolve_pool_type() == 'process' and not self.hybrid_mode:
+            workers = min(cores, 8)
+        else:
+            workers = min(cores, max(2, cores // 2))
+        batches = -(-file_count // self.batch_size)  # Ceiling division
+        return max(1, min(workers, batches))
+    
+    def _select_executor(self, max_workers: Optional[int] = None) -> Tuple[Any, bool]:
+        """
+        Create the executor for parallel conversion.
+        
+        Args:
+            max_workers: Worker count for this executor (None = self.max_workers)
+            
+        Returns:
+            Tuple of (executor, uses_processes)
+        """
+        # PDF rendering is pure-Python and CPU-bound, so with the GIL worker processes
+        # are needed to scale. Hybrid mode keeps threads: its translation dictionary
+        # lives on the shared converter.
+        if self._resolve_pool_type() == 'process' and not self.hybrid_mode:
+            context = multiprocessing.get_context('spawn')
+            self._worker_cancel_event = context.Event()
+            if self.cancelled:
+                self._worker_cancel_event.set()
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers or self.max_workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._worker_cancel_event,),
+            )
+            return executor, True
+        return ThreadPoolExecutor(max_workers=max_workers or self.max_workers), False
+    
+    def _fallback_to_threads(self, executor: Any, max_workers: Optional[int] = None) -> Any:
+        """
+        Replace a broken process pool with a thread pool for the remaining work.
+        
+        Spawned workers re-import the caller's __main__; without an
+        ``if __name__ == "__main__":`` guard they fail to start and the pool breaks.
+        """
+        print("Warning: Worker processes failed to start; continuing on a thread pool. "
+              "Guard the calling script with if __name__ == '__main__': or set SAKURA_POOL=thread.")
+        executor.shutdown(wait=False)
+        self._worker_cancel_event = None
+        return ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+    
+    def _submit_chunk(self, executor: Any, use_processes: bool, chunk: List[FileInfo]) -> Any:
+        """Submit one chunk of files to the executor and return its future."""
+        if use_processes:
+            return executor.submit(
+                _worker_convert_batch, chunk, str(self.output_dir), self.retry_count, self.retry_delay,
+                self.cache_dir,
+            )
+        return executor.submit(
+            _convert_batch, self.converter, chunk, self.retry_count, self.retry_delay, self._cancel_event
+        )
+    
     def _process_parallel(self, files: List[FileInfo], verbose: bool = True) -> tuple[int, int]:
         """Process files in parallel."""
         # Filter out already processed files
-        files_to_process = [
-            f for f in files
-            if not (self.resume and f.relative_path in self.processed_files)
-        ]
+        files_to_process = self._pending_files(files)
         
         if not files_to_process:
-            return len(files), 0
+            return 0, 0
         
         converted_count = 0
         failed_count = 0
         
-        # Use ThreadPoolExecutor for I/O-bound PDF generation
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        executor, use_processes = self._select_executor()
+        try:
             # Create progress bar
-            if tqdm and verbose:
+            tqdm = _get_tqdm() if verbose else None
+            if tqdm:
                 pbar = tqdm(
                     total=len(files_to_process),
                     desc="Converting files",
@@ -200,46 +412,92 @@ class CompressionPipeline:
             else:
                 pbar = None
             
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self._convert_file_with_retry, file_info): file_info
-                for file_info in files_to_process
-            }
+            # Submit work in batch_size chunks: one future (and, for processes, one
+            # pickle round-trip) per chunk instead of per file. Only a sliding window of
+            # chunks is in flight, so queued arguments and unread results stay bounded.
+            chunk_starts = iter(range(0, len(files_to_process), self.batch_size))
+            max_in_flight = self.max_workers * self.IN_FLIGHT_PER_WORKER
+            pending: Dict[Any, List[FileInfo]] = {}  # Future -> its chunk
+            requeued: List[List[FileInfo]] = []  # Chunks lost to a broken process pool
             
-            # Process completed tasks
-            for future in as_completed(future_to_file):
-                if self.cancelled:
-                    future.cancel()
-                    continue
+            is_cancelled = self._cancel_event.is_set
+            processed = self.processed_files
+            pdf_sizes = self.pdf_sizes
+            while True:
+                if is_cancelled():
+                    for future in pending:
+                        future.cancel()
+                    break
                 
-                file_info = future_to_file[future]
-                try:
-                    pdf_path, error = future.result()
-                    if pdf_path:
-                        converted_count += 1
-                        self.processed_files.add(file_info.relative_path)
+                # Top the window back up
+                while len(pending) < max_in_flight:
+                    if requeued:
+                        chunk = requeued.pop(0)
                     else:
-                        failed_count += 1
-                        self.failed_files.append({
-                            'file': file_info.relative_path,
-                            'error': error or 'Unknown error',
-                        })
-                except Exception as e:
-                    failed_count += 1
-                    self.failed_files.append({
-                        'file': file_info.relative_path,
-                        'error': str(e),
-                    })
+                        start = next(chunk_starts, None)
+                        if start is None:
+                            break
+                        chunk = files_to_process[start:start + self.batch_size]
+                    try:
+                        pending[self._submit_chunk(executor, use_processes, chunk)] = chunk
+                    except BrokenProcessPool:
+                        requeued.append(chunk)
+                        break
                 
-                if pbar:
-                    pbar.update(1)
-                    pbar.set_postfix({
-                        'converted': converted_count,
-                        'failed': failed_count,
-                    })
+                # Rerun everything the broken pool held on threads
+                if use_processes and (requeued or any(_is_broken(future) for future in pending)):
+                    requeued = list(pending.values()) + requeued
+                    pending.clear()
+                    executor = self._fallback_to_threads(executor)
+                    use_processes = False
+                    continue
+                if not pending:
+                    break
+                
+                # Process completed chunks
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if use_processes and _is_broken(future):
+                        continue  # Rerun on threads at the top of the loop
+                    chunk = pending.pop(future)
+                    try:
+                        if use_processes:
+                            chunk_results, stats = future.result()
+                            self.converter.merge_stats(stats)
+                        else:
+                            chunk_results = future.result()
+                    except Exception as e:
+                        chunk_results = [(file_info.relative_path, None, 0, str(e)) for file_info in chunk]
+                    
+                    chunk_processed = []
+                    chunk_failed = []
+                    for relative_path, pdf_path, pdf_size, error in chunk_results:
+                        if pdf_path:
+                            converted_count += 1
+                            processed.add(relative_path)
+                            pdf_sizes[relative_path] = pdf_size
+                            chunk_processed.append(relative_path)
+                        else:
+                            failed_count += 1
+                            chunk_failed.append({
+                                'file': relative_path,
+                                'error': error or 'Unknown error',
+                            })
+                    self.failed_files.extend(chunk_failed)
+                    self._save_checkpoint_batch(chunk_processed, chunk_failed)
+                    
+                    if pbar:
+                        pbar.update(len(chunk_results))
+                        pbar.set_postfix({
+                            'converted': converted_count,
+                            'failed': failed_count,
+                        })
             
             if pbar:
                 pbar.close()
+        finally:
+            executor.shutdown()
+        self._worker_cancel_event = None
         
         return converted_count, failed_count
     
@@ -270,6 +528,9 @@ class CompressionPipeline:
             self.failed_files = checkpoint.get('failed_files', [])
             if verbose and self.processed_files:
                 print(f"Resuming: {len(self.processed_files)} files already processed")
+        else:
+            self.processed_files = set()
+            self._reset_checkpoint()
         
         # Step 1: Discover files
         if verbose:
@@ -280,54 +541,24 @@ class CompressionPipeline:
         if verbose:
             self.discovery.print_summary()
         
+        # Unchanged sources keep their PDFs from the last run: treat them as processed
+        if self.incremental and files:
+            unchanged = self._find_unchanged(files)
+            self.processed_files.update(unchanged)
+            if verbose and unchanged:
+                print(f"Incremental: {len(unchanged)} unchanged files skipped")
+        
         if not files:
-            discovery_stats = self.discovery.generate_inventory_report()
-            unsupported = discovery_stats.get('statistics', {}).get('unsupported_files', {})
-            total_scanned = discovery_stats.get('statistics', {}).get('total_scanned', 0)
-            
-            # Build detailed error message
-            if unsupported:
-                unsupported_list = ', '.join(f"{ext} ({count})" for ext, count in sorted(
-                    unsupported.items(), key=lambda x: x[1], reverse=True
-                )[:5])  # Show top 5
-                if len(unsupported) > 5:
-                    unsupported_list += f" and {len(unsupported) - 5} more"
-                error_message = (
-                    f"No supported files discovered. Found {total_scanned} file(s) total, "
-                    f"but they are unsupported types: {unsupported_list}. "
-                    f"Sakura Sumi only processes text-based source code files. "
-                    f"See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types."
-                )
-            else:
-                error_message = (
-                    "No files discovered in the specified directory. "
-                    "Please ensure the directory contains supported source code files. "
-                    "See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types."
-                )
-            
-            if verbose:
-                print("No files found to process!")
-                if unsupported:
-                    print(f"\n⚠️  Found {total_scanned} file(s) but none are supported types.")
-                    print(f"   Unsupported file types: {', '.join(sorted(unsupported.keys()))}")
-                    print("   💡 Tip: Sakura Sumi only processes text-based source code files.")
-                    print("      See README.md for a complete list of supported file types.")
-            
-            failure_results = self._build_failure_result(
-                error_message=error_message,
-                discovery_stats=discovery_stats,
-                duration_seconds=(datetime.now() - self.start_time).total_seconds(),
-            )
-            self._emit_telemetry('pipeline_run', failure_results, {
-                'reason': 'no_files',
-                'total_scanned': total_scanned,
-                'unsupported_types': list(unsupported.keys()) if unsupported else []
-            })
-            return failure_results
+            return self._handle_no_files('pipeline_run', verbose)
         
         # Step 2: Convert files to PDFs
         if verbose:
             print(f"\nStep 2: Converting {len(files)} files to PDFs...")
+        
+        if self.parallel and self.autotune_workers:
+            self.max_workers = self._autotune_workers(len(files))
+        
+        if verbose:
             if self.parallel:
                 print(f"Using {self.max_workers} workers for parallel processing")
         
@@ -339,13 +570,11 @@ class CompressionPipeline:
             converted_count, failed_count = self._process_parallel(files, verbose)
         else:
             # Sequential processing with progress bar
-            files_to_process = [
-                f for f in files
-                if not (self.resume and f.relative_path in self.processed_files)
-            ]
+            files_to_process = self._pending_files(files)
             
             if files_to_process:
-                if tqdm and verbose:
+                tqdm = _get_tqdm() if verbose else None
+                if tqdm:
                     pbar = tqdm(
                         total=len(files_to_process),
                         desc="Converting files",
@@ -368,8 +597,11 @@ class CompressionPipeline:
                     converted_count += batch_converted
                     failed_count += batch_failed
                     
-                    # Save checkpoint after each batch
-                    self._save_checkpoint(self.processed_files, self.failed_files)
+                    # Append this batch's progress to the checkpoint log
+                    self._save_checkpoint_batch(
+                        [f.relative_path for f in batch if f.relative_path in self.processed_files],
+                        batch_errors,
+                    )
                     
                     batch_start = batch_end
                 
@@ -390,6 +622,8 @@ class CompressionPipeline:
         
         # Final checkpoint save
         self._save_checkpoint(self.processed_files, self.failed_files)
+        if self.incremental:
+            self._save_manifest(files)
         
         # Calculate metrics
         original_files = [
@@ -397,14 +631,7 @@ class CompressionPipeline:
             for f in files
         ]
         
-        # Get PDF file info
-        pdf_files = []
-        for pdf_path in self.output_dir.rglob('*.pdf'):
-            if pdf_path.is_file():
-                pdf_files.append({
-                    'size': pdf_path.stat().st_size,
-                    'path': str(pdf_path.relative_to(self.output_dir)),
-                })
+        pdf_files = self._collect_pdf_files()
         
         compression_metrics = self.metrics.calculate_metrics(
             original_files=original_files,
@@ -412,7 +639,7 @@ class CompressionPipeline:
             ocr_stats=None,  # Will be added if OCR is used
         )
         
-        files_already_processed = len(self.processed_files) - converted_count if self.resume else 0
+        files_already_processed = len(self.processed_files) - converted_count
         summary = self._create_summary(
             files_discovered=len(files),
             files_converted=converted_count,
@@ -424,8 +651,8 @@ class CompressionPipeline:
         results = {
             'success': True,
             'cancelled': self.cancelled,
-            'source_directory': self._sanitize_path(self.source_dir),  # Sanitized: basename only
-            'output_directory': self._sanitize_path(self.output_dir),  # Sanitized: basename only
+            'source_directory': self._source_basename,  # Sanitized: basename only
+            'output_directory': self._output_basename,  # Sanitized: basename only
             'duration_seconds': duration,
             'discovery': discovery_stats,
             'conversion': conversion_stats,
@@ -440,9 +667,28 @@ class CompressionPipeline:
         
         self._write_failure_report(results)
         self._attach_telemetry_reference(results)
-        self._emit_telemetry('pipeline_run', results)
+        self._emit_telemetry('pipeline_run', results, {'parallel': self.parallel, 'workers': self.max_workers})
         return results
     
+    def _collect_pdf_files(self) -> List[Dict[str, Any]]:
+        """
+        List the PDFs behind this run's processed files without re-walking the output tree.
+        
+        Sizes for files converted in this run were recorded as they completed; only
+        files carried over from a resumed checkpoint need a stat.
+        """
+        pdf_files = []
+        for relative_path in self.processed_files:
+            pdf_relative = Path(relative_path).with_suffix('.pdf')
+            size = self.pdf_sizes.get(relative_path)
+            if size is None:
+                pdf_path = self.output_dir / pdf_relative
+                if not pdf_path.is_file():
+                    continue
+                size = pdf_path.stat().st_size
+            pdf_files.append({'size': size, 'path': str(pdf_relative)})
+        return pdf_files
+    
     def _print_metrics_summary(self, metrics: Dict[str, Any]):
         """Print metrics summary."""
         print(f"\n{'='*60}")
@@ -509,7 +755,8 @@ class CompressionPipeline:
     ) -> dict:
         """
         Run compression with smart concatenation strategy.
-        Ensures exactly max_pdfs (default 10) PDFs maximum.
+        Groups files into at most max_pdfs (default 10) groups; a group that exceeds
+        max_pages_per_pdf or max_size_per_pdf_mb continues in extra _partN PDFs.
         
         Args:
             max_pdfs: Maximum number of PDFs to create (hard limit)
@@ -545,49 +792,7 @@ class CompressionPipeline:
             self.discovery.print_summary()
         
         if not files:
-            discovery_stats = self.discovery.generate_inventory_report()
-            unsupported = discovery_stats.get('statistics', {}).get('unsupported_files', {})
-            total_scanned = discovery_stats.get('statistics', {}).get('total_scanned', 0)
-            
-            # Build detailed error message
-            if unsupported:
-                unsupported_list = ', '.join(f"{ext} ({count})" for ext, count in sorted(
-                    unsupported.items(), key=lambda x: x[1], reverse=True
-                )[:5])  # Show top 5
-                if len(unsupported) > 5:
-                    unsupported_list += f" and {len(unsupported) - 5} more"
-                error_message = (
-                    f"No supported files discovered. Found {total_scanned} file(s) total, "
-                    f"but they are unsupported types: {unsupported_list}. "
-                    f"Sakura Sumi only processes text-based source code files. "
-                    f"See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types."
-                )
-            else:
-                error_message = (
-                    "No files discovered in the specified directory. "
-                    "Please ensure the directory contains supported source code files. "
-                    "See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types."
-                )
-            
-            if verbose:
-                print("No files found to process!")
-                if unsupported:
-                    print(f"\n⚠️  Found {total_scanned} file(s) but none are supported types.")
-                    print(f"   Unsupported file types: {', '.join(sorted(unsupported.keys()))}")
-                    print("   💡 Tip: Sakura Sumi only processes text-based source code files.")
-                    print("      See README.md for a complete list of supported file types.")
-            
-            failure_results = self._build_failure_result(
-                error_message=error_message,
-                discovery_stats=discovery_stats,
-                duration_seconds=(datetime.now() - self.start_time).total_seconds(),
-            )
-            self._emit_telemetry('pipeline_smart_concatenation', failure_results, {
-                'reason': 'no_files',
-                'total_scanned': total_scanned,
-                'unsupported_types': list(unsupported.keys()) if unsupported else []
-            })
-            return failure_results
+            return self._handle_no_files('pipeline_smart_concatenation', verbose)
         
         # Step 2: Group files using smart concatenation
         if verbose:
@@ -624,31 +829,29 @@ class CompressionPipeline:
         failed_count = 0
         pdf_results = []
         
-        for group in pdf_groups:
-            if self.cancelled:
-                break
-            
-            pdf_path = self.converter.concatenate_files_to_pdf(
-                files=group.files,
-                pdf_name=group.name.replace('.pdf', ''),
-                max_pages=max_pages_per_pdf,
-                max_size_bytes=max_size_per_pdf_mb * 1024 * 1024,
-            )
-            
-            if pdf_path:
-                converted_count += len(group.files)
+        for group, parts in self._render_groups(
+            pdf_groups,
+            max_pages=max_pages_per_pdf,
+            max_size_bytes=max_size_per_pdf_mb * 1024 * 1024,
+        ):
+            # Files past the page or size limit continue in <group>_partN PDFs
+            rendered = set()
+            for index, (pdf_path, pdf_size, included) in enumerate(parts):
+                converted_count += len(included)
+                rendered.update(f.relative_path for f in included)
                 pdf_results.append({
-                    'name': group.name,
+                    'name': group.name if index == 0 else pdf_path.name,
                     'path': str(pdf_path.relative_to(self.output_dir)),
-                    'file_count': len(group.files),
-                    'size_bytes': pdf_path.stat().st_size if pdf_path.exists() else 0,
+                    'file_count': len(included),
+                    'size_bytes': pdf_size,
                 })
-            else:
-                failed_count += len(group.files)
+            missing = [f.relative_path for f in group.files if f.relative_path not in rendered]
+            if missing:
+                failed_count += len(missing)
                 self.failed_files.append({
                     'group': group.name,
-                    'files': [f.relative_path for f in group.files],
-                    'error': 'PDF generation failed'
+                    'files': missing,
+                    'error': 'PDF generation failed' if not parts else 'File could not be read or rendered'
                 })
         
         if verbose:
@@ -694,8 +897,8 @@ class CompressionPipeline:
         results = {
             'success': True,
             'cancelled': self.cancelled,
-            'source_directory': self._sanitize_path(self.source_dir),  # Sanitized: basename only
-            'output_directory': self._sanitize_path(self.output_dir),  # Sanitized: basename only
+            'source_directory': self._source_basename,  # Sanitized: basename only
+            'output_directory': self._output_basename,  # Sanitized: basename only
             'duration_seconds': duration,
             'discovery': discovery_stats,
             'conversion': conversion_stats,
@@ -718,14 +921,82 @@ class CompressionPipeline:
         self._emit_telemetry('pipeline_smart_concatenation', results)
         return results
     
+    def _render_groups(
+        self,
+        pdf_groups: List[Any],
+        max_pages: int,
+        max_size_bytes: int,
+    ) -> Iterator[Tuple[Any, List[Tuple[Path, int, List[FileInfo]]]]]:
+        """
+        Concatenate each smart-concatenation group into its PDFs, yielding (group, parts) in order.
+        
+        Each part is (pdf_path, pdf_size, included_files); a group gets more than one
+        part when its files don't fit within max_pages or max_size_bytes.
+        
+        Groups are independent, so with parallel enabled they render concurrently, each
+        worker on its own converter. Hybrid mode stays serial: its translation dictionary
+        lives on the shared converter and goes into the first PDF.
+        """
+        if not self.parallel or self.hybrid_mode or len(pdf_groups) < 2:
+            for group in pdf_groups:
+                if self.cancelled:
+                    return
+                yield group, self.converter.concatenate_files_to_pdfs(
+                    group.files,
+                    group.name.replace('.pdf', ''),
+                    max_pages=max_pages,
+                    max_size_bytes=max_size_bytes,
+                )
+            return
+        
+        workers = min(self.max_workers, len(pdf_groups))
+        executor, _ = self._select_executor(workers)
+        
+        def submit(group: Any) -> Any:
+            return executor.submit(
+                _concatenate_worker, str(self.output_dir), group.files,
+                group.name.replace('.pdf', ''), max_pages, max_size_bytes,
+            )
+        
+        try:
+            try:
+                futures = [submit(group) for group in pdf_groups]
+            except BrokenProcessPool:
+                executor = self._fallback_to_threads(executor, workers)
+                futures = [submit(group) for group in pdf_groups]
+            for index, group in enumerate(pdf_groups):
+                if self.cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                try:
+                    try:
+                        parts, stats = futures[index].result()
+                    except BrokenProcessPool:
+                        # Rerun this group and every later one on threads
+                        executor = self._fallback_to_threads(executor, workers)
+                        futures[index:] = [submit(remaining) for remaining in pdf_groups[index:]]
+                        parts, stats = futures[index].result()
+                    self.converter.merge_stats(stats)
+                except Exception as e:
+                    parts = []
+                    self.converter.conversion_stats['errors'].append({'file': group.name, 'error': str(e)})
+                yield group, parts
+        finally:
+            executor.shutdown()
+        self._worker_cancel_event = None
+    
+    # (unit, divisor) per power of 1024, indexed by (bit_length - 1) // 10
+    _SIZE_UNITS = (('B', 1), ('KB', 1 << 10), ('MB', 1 << 20), ('GB', 1 << 30), ('TB', 1 << 40))
+    
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """Format bytes into human-readable size."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.2f} B"
+        index = min((int(size_bytes).bit_length() - 1) // 10, 4)
+        unit, divisor = CompressionPipeline._SIZE_UNITS[index]
+        return f"{size_bytes / divisor:.2f} {unit}"
 
     def _sanitize_path(self, path: Path) -> str:
         """
@@ -743,12 +1014,16 @@ class CompressionPipeline:
     
     def _prepare_conversion_stats(self) -> Dict[str, Any]:
         stats = self.converter.get_stats()
-        return {
+        # Size/ratio keys first (defaulted when missing), then everything else in one pass
+        prepared = {
             'total_size_original': stats.get('total_size_original', 0),
             'total_size_pdf': stats.get('total_size_pdf', 0),
             'compression_ratio': stats.get('compression_ratio', 0.0),
-            **{k: v for k, v in stats.items() if k not in {'total_size_original', 'total_size_pdf', 'compression_ratio'}}
         }
+        for key, value in stats.items():
+            if key not in prepared:
+                prepared[key] = value
+        return prepared
 
     def _create_summary(
         self,
@@ -770,6 +1045,62 @@ class CompressionPipeline:
             'compression_ratio': stats.get('compression_ratio', 0.0),
         }
 
+    def _handle_no_files(self, telemetry_event: str, verbose: bool) -> Dict[str, Any]:
+        """
+        Build, report and log the failure result for a run that discovered no supported files.
+        
+        Args:
+            telemetry_event: Telemetry event name of the calling pipeline mode
+            verbose: Print the explanation and tips
+            
+        Returns:
+            Failure results dictionary
+        """
+        discovery_stats = self.discovery.generate_inventory_report()
+        unsupported = discovery_stats.get('statistics', {}).get('unsupported_files', {})
+        total_scanned = discovery_stats.get('statistics', {}).get('total_scanned', 0)
+        
+        # Build detailed error message
+        if unsupported:
+            unsupported_list = ', '.join(
+                f"{ext} ({count})"
+                for ext, count in heapq.nlargest(5, unsupported.items(), key=lambda x: x[1])
+            )  # Show top 5
+            if len(unsupported) > 5:
+                unsupported_list += f" and {len(unsupported) - 5} more"
+            error_message = (
+                f"No supported files discovered. Found {total_scanned} file(s) total, "
+                f"but they are unsupported types: {unsupported_list}. "
+                f"Sakura Sumi only processes text-based source code files. "
+                f"See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types."
+            )
+        else:
+            error_message = (
+                "No files discovered in the specified directory. "
+                "Please ensure the directory contains supported source code files. "
+                "See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types."
+            )
+        
+        if verbose:
+            print("No files found to process!")
+            if unsupported:
+                print(f"\n⚠️  Found {total_scanned} file(s) but none are supported types.")
+                print(f"   Unsupported file types: {', '.join(sorted(unsupported.keys()))}")
+                print("   💡 Tip: Sakura Sumi only processes text-based source code files.")
+                print("      See README.md for a complete list of supported file types.")
+        
+        failure_results = self._build_failure_result(
+            error_message=error_message,
+            discovery_stats=discovery_stats,
+            duration_seconds=(datetime.now() - self.start_time).total_seconds(),
+        )
+        self._emit_telemetry(telemetry_event, failure_results, {
+            'reason': 'no_files',
+            'total_scanned': total_scanned,
+            'unsupported_types': list(unsupported.keys()) if unsupported else []
+        })
+        return failure_results
+    
     def _build_failure_result(
         self,
         error_message: str,
@@ -789,8 +1120,8 @@ class CompressionPipeline:
         result = {
             'success': False,
             'cancelled': self.cancelled,
-            'source_directory': self._sanitize_path(self.source_dir),  # Sanitized: basename only
-            'output_directory': self._sanitize_path(self.output_dir),  # Sanitized: basename only
+            'source_directory': self._source_basename,  # Sanitized: basename only
+            'output_directory': self._output_basename,  # Sanitized: basename only
             'duration_seconds': duration_seconds,
             'discovery': discovery_stats,
             'conversion': conversion_stats,
@@ -828,26 +1159,171 @@ class CompressionPipeline:
         
         if not report_needed:
             results['failure_report'] = None
-            if self.failure_report_path.exists():
-                try:
-                    self.failure_report_path.unlink()
-                except Exception as exc:
-                    print(f"Warning: Could not delete failure report: {exc}")
+            try:
+                self.failure_report_path.unlink(missing_ok=True)
+            except OSError as exc:
+                print(f"Warning: Could not delete failure report: {exc}")
             return
         
         report = {
             'generated_at': datetime.now().isoformat(),
-            'source_directory': self._sanitize_path(self.source_dir),  # Sanitized: basename only
-            'output_directory': self._sanitize_path(self.output_dir),  # Sanitized: basename only
+            'source_directory': self._source_basename,  # Sanitized: basename only
+            'output_directory': self._output_basename,  # Sanitized: basename only
             'failures': failures,
             'conversion_errors': conversion_errors,
         }
         
         try:
             self.failure_report_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.failure_report_path.open('w', encoding='utf-8') as handle:
-                json.dump(report, handle, indent=2)
+            _write_json(self.failure_report_path, report, indent=True)
             results['failure_report'] = str(self.failure_report_path)
         except Exception as exc:
             print(f"Warning: Could not write failure report: {exc}")
             results['failure_report'] = None
+
+
+_tqdm: Any = False  # Not yet imported; None once the import has failed
+
+
+def _get_tqdm() -> Optional[Callable]:
+    """Import tqdm on first use (progress bars are only drawn for verbose runs)."""
+    global _tqdm
+    if _tqdm is False:
+        try:
+            from tqdm import tqdm as _tqdm
+        except ImportError:
+            _tqdm = None
+    return _tqdm
+
+
+def _dumps(data: Any) -> str:
+    """Serialize to compact single-line JSON (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass  # Non-str keys, integers beyond 64 bits, etc.: let the stdlib decide
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text (orjson when installed); raises ValueError on bad input."""
+    if orjson is not None:
+        return orjson.loads(text)  # orjson.JSONDecodeError subclasses ValueError
+    return json.loads(text)
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any, indent: bool = False) -> None:
+    """Write a JSON file, two-space indented when indent is set (orjson when installed)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            path.write_bytes(orjson.dumps(data, option=option))
+            return
+        except TypeError:
+            pass
+    # Encode fully first and write bytes once: json.dump issues one small write per
+    # token, and a text-mode file adds a TextIOWrapper encode on top
+    text = json.dumps(data, indent=2) if indent else json.dumps(data, separators=(',', ':'))
+    path.write_bytes(text.encode('utf-8'))
+
+
+def _convert_with_retry(
+    converter: PDFConverter,
+    file_info: FileInfo,
+    retry_count: int,
+    retry_delay: float,
+    cancel_event: Any,
+) -> Tuple[Optional[Path], int, Optional[str]]:
+    """
+    Convert a file, retrying with increasing backoff; returns (pdf_path, pdf_size, error).
+    
+    The size comes from the converter's in-memory PDF data, so callers need no stat().
+    
+    cancel_event is a threading or multiprocessing Event: backoff waits on it,
+    so cancellation interrupts a retry delay instead of sleeping it out.
+    """
+    last_error = None
+    
+    for attempt in range(retry_count):
+        if cancel_event.is_set():
+            return None, 0, "Cancelled"
+        
+        try:
+            pdf_path, pdf_size = converter._convert_file_sized(file_info)
+            if pdf_path:
+                return pdf_path, pdf_size, None
+            else:
+                last_error = "PDF generation returned None"
+        except Exception as e:
+            last_error = str(e)
+        
+        if attempt < retry_count - 1 and cancel_event.wait(retry_delay * (attempt + 1)):  # Linear backoff
+            return None, 0, "Cancelled"
+    
+    return None, 0, last_error
+
+
+def _convert_batch(
+    converter: PDFConverter,
+    files: List[FileInfo],
+    retry_count: int,
+    retry_delay: float,
+    cancel_event: Any,
+) -> List[Tuple[str, Optional[Path], int, Optional[str]]]:
+    """Convert a chunk of files; returns (relative_path, pdf_path, pdf_size, error) per file."""
+    results = []
+    for file_info in files:
+        pdf_path, pdf_size, error = _convert_with_retry(converter, file_info, retry_count, retry_delay, cancel_event)
+        results.append((file_info.relative_path, pdf_path, pdf_size, error))
+    return results
+
+
+# One converter per worker process and (output_dir, cache_dir), created on first use
+_worker_converters: Dict[Tuple[str, Optional[str]], PDFConverter] = {}
+
+# Cancellation flag shared with the parent; stays unset when no initializer ran
+_worker_cancel_event: Any = threading.Event()
+
+
+def _is_broken(future: Any) -> bool:
+    """Return True if a process-pool future failed because the pool broke."""
+    return future.done() and not future.cancelled() and isinstance(future.exception(), BrokenProcessPool)
+
+
+def _init_worker(cancel_event: Any) -> None:
+    """Process pool initializer: adopt the parent's cancellation event."""
+    global _worker_cancel_event
+    _worker_cancel_event = cancel_event
+    # The worker runs only conversions, so pausing GC can't stall unrelated threads
+    enable_gc_pause()
+
+
+def _worker_convert_batch(
+    files: List[FileInfo],
+    output_dir: str,
+    retry_count: int,
+    retry_delay: float,
+    cache_dir: Optional[str] = None,
+) -> Tuple[List[Tuple[str, Optional[Path], int, Optional[str]]], Dict[str, Any]]:
+    """
+    Convert a chunk of files in a worker process.
+    
+    Returns:
+        Tuple of (per-file (relative_path, pdf_path, pdf_size, error) results, conversion_stats for the chunk)
+    """
+    key = (output_dir, cache_dir)
+    converter = _worker_converters.get(key)
+    if converter is None:
+        converter = _worker_converters[key] = PDFConverter(output_dir, cache_dir=cache_dir)
+    
+    results = _convert_batch(converter, files, retry_count, retry_delay, _worker_cancel_event)
+    return results, converter.reset_stats()
@@ -1,16 +1,25 @@
 """Smart concatenation engine with prioritized roll-up strategy."""
 
+import heapq
+import os
+import re
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
 from collections import defaultdict
+from itertools import chain
 from dataclasses import dataclass
 
 from ..utils.file_discovery import FileInfo
 
+_UNDERSCORE_RUN = re.compile(r'_{2,}')
+
 
 @dataclass
 class PDFGroup:
     """Represents a group of files to be concatenated into one PDF."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10; fields have no defaults)
+    __slots__ = ('name', 'files', 'directory_path', 'priority')
+    
     name: str  # e.g., "src_components.pdf"
     files: List[FileInfo]
     directory_path: str  # e.g., "src/components"
@@ -24,10 +33,10 @@ class SmartConcatenationEngine:
     """
     
     # Default key project folders that get priority
-    DEFAULT_KEY_FOLDERS = {
+    DEFAULT_KEY_FOLDERS = frozenset({
         'src', 'components', 'api', 'services', 'utils', 'lib', 
         'public', 'tests', 'test', 'specs', 'config', 'scripts'
-    }
+    })
     
     def __init__(
         self,
@@ -44,7 +53,7 @@ class SmartConcatenationEngine:
         self.max_size_per_pdf_bytes = max_size_per_pdf_mb * 1024 * 1024
         self.max_total_pages = max_total_pages
         # Use custom key folders if provided, otherwise use defaults
-        self.key_folders = set(key_folders) if key_folders else self.DEFAULT_KEY_FOLDERS.copy()
+        self.key_folders = frozenset(key_folders) if key_folders else self.DEFAULT_KEY_FOLDERS
     
     def build_directory_tree(self, files: List[FileInfo]) -> Tuple[Dict[str, List[FileInfo]], List[FileInfo]]:
         """
@@ -54,14 +63,18 @@ class SmartConcatenationEngine:
         """
         tree = defaultdict(list)
         root_files = []
+        # Directory keys are '/'-separated everywhere in this engine
+        native_sep = os.sep if os.sep != '/' else None
         
         for file_info in files:
-            # Get directory path (parent of file)
-            file_path = Path(file_info.relative_path)
-            if len(file_path.parts) > 1:
+            # Get directory path (parent of file) with one string search, no Path objects
+            relative_path = file_info.relative_path
+            if native_sep:
+                relative_path = relative_path.replace(native_sep, '/')
+            slash = relative_path.rfind('/')
+            if slash > 0:
                 # File is in a subdirectory
-                dir_path = str(file_path.parent)
-                tree[dir_path].append(file_info)
+                tree[relative_path[:slash]].append(file_info)
             else:
                 # File is at root
                 root_files.append(file_info)
@@ -77,9 +90,9 @@ class SmartConcatenationEngine:
                 continue
             
             # Get first component (top-level folder)
-            parts = dir_path.split('/')
-            if parts and parts[0] in self.key_folders:
-                key_folders.add(parts[0])
+            top_level = dir_path.partition('/')[0]
+            if top_level in self.key_folders:
+                key_folders.add(top_level)
         
         return key_folders
     
@@ -90,13 +103,13 @@ class SmartConcatenationEngine:
         """
         priority = 0
         
-        # Key folders get high priority
-        parts = dir_path.split('/') if dir_path else []
-        if parts and parts[0] in self.key_folders:
+        # Key folders get high priority (top-level component and depth without splitting)
+        if dir_path and dir_path.partition('/')[0] in self.key_folders:
             priority += 1000
         
         # Deeper directories get higher priority (we want to preserve granularity)
-        priority += len(parts) * 10
+        depth = dir_path.count('/') + 1 if dir_path else 0
+        priority += depth * 10
         
         # More files = higher priority
         priority += min(file_count, 100)  # Cap at 100
@@ -108,33 +121,41 @@ class SmartConcatenationEngine:
     
     def roll_up_directories(
         self, 
-        dir_tree: Dict[str, List[FileInfo]]
+        dir_tree: Dict[str, List[FileInfo]],
+        dir_sizes: Optional[Dict[str, int]] = None,
     ) -> Dict[str, List[FileInfo]]:
         """
         Roll up child directories into parents when count > max_pdfs.
         Traverses from deepest to shallowest.
+        If dir_sizes is given, merged children's sizes are added to their parents' totals.
+        
+        dir_tree is merged in place and returned (merged file lists were always
+        extended in place); pass a copy if the original mapping is still needed.
         """
         if len(dir_tree) <= self.max_pdfs:
             return dir_tree
         
-        # Build depth map: {depth: [dir_paths]}
+        # Build depth map {depth: [dir_paths]} and each directory's parent, once.
+        # Directories are visited in sorted order, so each depth's list comes out
+        # sorted (deterministic roll-up regardless of os.walk order) without re-sorting.
         depth_map = defaultdict(list)
-        for dir_path in dir_tree.keys():
-            depth = len(dir_path.split('/')) if dir_path else 0
+        parents = {}
+        for dir_path in sorted(dir_tree):
+            depth = dir_path.count('/') + 1 if dir_path else 0
             depth_map[depth].append(dir_path)
+            slash = dir_path.rfind('/')
+            parents[dir_path] = dir_path[:slash] if slash > 0 else None
         
         # Start from deepest directories
         max_depth = max(depth_map.keys()) if depth_map else 0
-        merged_tree = dir_tree.copy()
+        merged_tree = dir_tree
         
         # Traverse from deepest to shallowest
         for depth in range(max_depth, 0, -1):
             if len(merged_tree) <= self.max_pdfs:
                 break
             
-            dirs_at_depth = sorted(depth_map[depth])
-            
-            for dir_path in dirs_at_depth:
+            for dir_path in depth_map[depth]:
                 if len(merged_tree) <= self.max_pdfs:
                     break
                 
@@ -142,14 +163,14 @@ class SmartConcatenationEngine:
                     continue
                 
                 # Find parent directory
-                parts = dir_path.split('/')
-                if len(parts) > 1:
-                    parent_path = '/'.join(parts[:-1])
-                    
+                parent_path = parents[dir_path]
+                if parent_path is not None:
                     # Merge this directory into parent
                     if parent_path in merged_tree:
                         merged_tree[parent_path].extend(merged_tree[dir_path])
                         del merged_tree[dir_path]
+                        if dir_sizes is not None:
+                            dir_sizes[parent_path] += dir_sizes[dir_path]
         
         return merged_tree
     
@@ -163,6 +184,7 @@ class SmartConcatenationEngine:
         """
         # Step 1: Build directory tree and separate root files
         dir_tree, root_files = self.build_directory_tree(files)
+        dir_sizes = {dir_path: sum(f.size for f in dir_files) for dir_path, dir_files in dir_tree.items()}
         
         # Step 2: Identify key folders
         key_folders = self.identify_key_folders(dir_tree)
@@ -175,55 +197,36 @@ class SmartConcatenationEngine:
         if len(dir_tree) <= self.max_pdfs:
             # Simple case: keep all directories as separate PDFs
             for dir_path, dir_files in dir_tree.items():
-                pdf_name = self._sanitize_pdf_name(dir_path) if dir_path else "misc.pdf"
-                total_size = sum(f.size for f in dir_files)
-                groups.append(PDFGroup(
-                    name=f"{pdf_name}.pdf",
-                    files=dir_files,
-                    directory_path=dir_path,
-                    priority=self.calculate_directory_priority(dir_path, len(dir_files), total_size)
-                ))
+                groups.append(self._directory_group(dir_path, dir_files, dir_sizes[dir_path]))
         else:
             # We have > max_pdfs directories - need to group/roll-up
             # Strategy: Prioritize key folders, roll up their subdirectories if needed
             
             # First, separate key folders from others
-            key_folder_groups = {}
+            key_folder_dirs = defaultdict(list)  # Top-level key folder -> its directory paths
             other_dirs = {}
             
             for dir_path, dir_files in dir_tree.items():
-                parts = dir_path.split('/')
-                top_level = parts[0] if parts else ""
+                top_level = dir_path.partition('/')[0]
                 
                 if top_level in key_folders:
-                    if top_level not in key_folder_groups:
-                        key_folder_groups[top_level] = {}
-                    key_folder_groups[top_level][dir_path] = dir_files
+                    key_folder_dirs[top_level].append(dir_path)
                 else:
                     other_dirs[dir_path] = dir_files
             
             # Process key folders: try to keep subdirectories separate if possible
-            for folder_name, subdirs in key_folder_groups.items():
+            for folder_name, subdirs in key_folder_dirs.items():
                 # Calculate how many slots we have left (accounting for root files)
                 slots_for_key_folders = self.max_pdfs - len(other_dirs) - 1  # -1 for potential root/misc
                 
                 if len(subdirs) <= slots_for_key_folders:
                     # We have room - keep subdirectories separate
-                    for dir_path, dir_files in subdirs.items():
-                        total_size = sum(f.size for f in dir_files)
-                        pdf_name = self._sanitize_pdf_name(dir_path)
-                        groups.append(PDFGroup(
-                            name=f"{pdf_name}.pdf",
-                            files=dir_files,
-                            directory_path=dir_path,
-                            priority=self.calculate_directory_priority(dir_path, len(dir_files), total_size)
-                        ))
+                    for dir_path in subdirs:
+                        groups.append(self._directory_group(dir_path, dir_tree[dir_path], dir_sizes[dir_path]))
                 else:
                     # Too many subdirectories - roll up into single PDF
-                    all_files = []
-                    for dir_files in subdirs.values():
-                        all_files.extend(dir_files)
-                    total_size = sum(f.size for f in all_files)
+                    all_files = list(chain.from_iterable(dir_tree[dir_path] for dir_path in subdirs))
+                    total_size = sum(dir_sizes[dir_path] for dir_path in subdirs)
                     groups.append(PDFGroup(
                         name=f"{folder_name}.pdf",
                         files=all_files,
@@ -233,18 +236,11 @@ class SmartConcatenationEngine:
             
             # Handle other directories - apply roll-up if still needed
             if len(groups) + len(other_dirs) > self.max_pdfs:
-                other_dirs = self.roll_up_directories(other_dirs)
+                other_dirs = self.roll_up_directories(other_dirs, dir_sizes)
             
             # Add other directories as groups
             for dir_path, dir_files in other_dirs.items():
-                pdf_name = self._sanitize_pdf_name(dir_path) if dir_path else "misc.pdf"
-                total_size = sum(f.size for f in dir_files)
-                groups.append(PDFGroup(
-                    name=f"{pdf_name}.pdf",
-                    files=dir_files,
-                    directory_path=dir_path,
-                    priority=self.calculate_directory_priority(dir_path, len(dir_files), total_size)
-                ))
+                groups.append(self._directory_group(dir_path, dir_files, dir_sizes[dir_path]))
         
         # Step 5: Handle root files - CRITICAL: Must be included in the 10-PDF limit
         # Count how many slots we have left
@@ -276,8 +272,7 @@ class SmartConcatenationEngine:
                     # Merge lowest priority group into misc
                     if groups:
                         groups = sorted(groups, key=lambda g: g.priority, reverse=True)
-                        misc_files = groups[-1].files.copy()
-                        misc_files.extend(root_files)
+                        misc_files = groups[-1].files + root_files
                         groups[-1] = PDFGroup(
                             name="misc.pdf",
                             files=misc_files,
@@ -292,38 +287,32 @@ class SmartConcatenationEngine:
         # Final validation: ensure we have exactly max_pdfs or fewer
         if len(groups) > self.max_pdfs:
             # Emergency fallback: take top N-1, merge rest into misc
-            groups = sorted(groups, key=lambda g: g.priority, reverse=True)
-            top_groups = groups[:self.max_pdfs - 1]
-            misc_files = []
-            for group in groups[self.max_pdfs - 1:]:
-                misc_files.extend(group.files)
-            
-            if misc_files:
-                top_groups.append(PDFGroup(
-                    name="misc.pdf",
-                    files=misc_files,
-                    directory_path="misc",
-                    priority=0
-                ))
-            groups = top_groups
+            groups = self._apply_misc_bucket(groups)
         
         return groups
     
+    def _directory_group(self, dir_path: str, dir_files: List[FileInfo], total_size: int) -> PDFGroup:
+        """Create the PDFGroup for one directory, named after its path."""
+        pdf_name = self._sanitize_pdf_name(dir_path) if dir_path else "misc.pdf"
+        return PDFGroup(
+            name=f"{pdf_name}.pdf",
+            files=dir_files,
+            directory_path=dir_path,
+            priority=self.calculate_directory_priority(dir_path, len(dir_files), total_size)
+        )
+    
     def _apply_misc_bucket(self, groups: List[PDFGroup]) -> List[PDFGroup]:
         """
         Fallback: Select top (max_pdfs - 1) groups, merge rest into misc.pdf
         This ensures exactly max_pdfs total.
         """
-        # Sort by priority (highest first)
-        sorted_groups = sorted(groups, key=lambda g: g.priority, reverse=True)
-        
-        # Take top (max_pdfs - 1) to leave room for misc
-        top_groups = sorted_groups[:self.max_pdfs - 1]
+        # Take top (max_pdfs - 1) by priority, highest first, to leave room for misc;
+        # a partial heap selection rather than sorting every group
+        top_groups = heapq.nlargest(self.max_pdfs - 1, groups, key=lambda g: g.priority)
         
-        # Collect all files from remaining groups
-        misc_files = []
-        for group in sorted_groups[self.max_pdfs - 1:]:
-            misc_files.extend(group.files)
+        # Collect all files from remaining groups, in their original order
+        selected = {id(group) for group in top_groups}
+        misc_files = list(chain.from_iterable(group.files for group in groups if id(group) not in selected))
         
         # Create misc group (this makes exactly max_pdfs total)
         if misc_files:
@@ -338,12 +327,6 @@ class SmartConcatenationEngine:
     
     def _sanitize_pdf_name(self, dir_path: str) -> str:
         """Convert directory path to PDF filename."""
-        # Replace / with _
-        name = dir_path.replace('/', '_')
-        # Remove leading/trailing underscores
-        name = name.strip('_')
-        # Replace multiple underscores with single
-        while '__' in name:
-            name = name.replace('__', '_')
-        return name or "misc"
+        # Replace / with _, collapse runs of underscores in one pass, trim the ends
+        return _UNDERSCORE_RUN.sub('_', dir_path.replace('/', '_')).strip('_') or "misc"
 
@@ -6,7 +6,6 @@ import argparse
 from pathlib import Path
 
 from .compression.pipeline import CompressionPipeline
-from .utils.metrics import create_visualizations
 
 
 # Force unbuffered output for better visibility in Automator
@@ -14,8 +13,8 @@ sys.stdout.reconfigure(line_buffering=True) if hasattr(sys.stdout, 'reconfigure'
 sys.stderr.reconfigure(line_buffering=True) if hasattr(sys.stderr, 'reconfigure') else None
 
 
-def main():
-    """Main CLI entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description='🌸 Sakura Sumi - OCR Compression System - Convert codebase to compressed PDFs for LLM analysis'
     )
@@ -50,7 +49,7 @@ def main():
         '--workers',
         type=int,
         default=None,
-        help='Number of parallel workers (default: CPU count - 1)'
+        help='Number of parallel workers (default: auto, up to 8 processes or half the CPU cores as threads, capped by the work available)'
     )
     parser.add_argument(
         '--batch-size',
@@ -63,6 +62,18 @@ def main():
         action='store_true',
         help='Resume from checkpoint if available'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip files unchanged since the previous run (per-file mode only)'
+    )
+    parser.add_argument(
+        '--pdf-cache',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help='Directory for caching generated PDFs across runs (per-file mode only)'
+    )
     parser.add_argument(
         '--retry',
         type=int,
@@ -114,7 +125,7 @@ def main():
         '--max-pages-per-pdf',
         type=int,
         default=100,
-        help='Maximum pages per PDF (default: 100)'
+        help='Maximum pages per PDF; groups that exceed it continue in _partN PDFs (default: 100)'
     )
     parser.add_argument(
         '--max-size-per-pdf-mb',
@@ -140,8 +151,12 @@ def main():
         action='store_true',
         help='Disable topological sorting (use alphabetical order instead)'
     )
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    args = _build_parser().parse_args()
     
     # Validate source directory and resolve to absolute path
     source_path = Path(args.source_dir).expanduser().resolve()
@@ -198,6 +213,8 @@ def main():
         batch_size=args.batch_size,
         resume=args.resume,
         retry_count=args.retry,
+        incremental=args.incremental,
+        cache_dir=str(Path(args.pdf_cache).expanduser()) if args.pdf_cache else None,
     )
     
     # Run pipeline
@@ -238,6 +255,7 @@ def main():
             
             # Generate charts if requested
             if args.generate_charts:
+                from .utils.metrics import create_visualizations
                 charts = create_visualizations(results['metrics'], output_dir / 'charts')
                 if charts:
                     print(f"✓ Generated {len(charts)} visualization charts in: {output_dir / 'charts'}")
@@ -5,13 +5,15 @@ from pathlib import Path
 
 # Add project root to path if running directly
 if __name__ == '__main__':
-    project_root = Path(__file__).parent.parent.parent
-    sys.path.insert(0, str(project_root))
-
-from ..web.app import create_app
+    project_root = str(Path(__file__).parent.parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
 def main():
     """Main entry point for web portal."""
+    # Deferred so importing this module doesn't pull in Flask and the compression stack
+    from ..web.app import create_app
+
     app = create_app()
     port = 5001  # Use 5001 to avoid conflict with macOS AirPlay
     print("Starting 🌸 Sakura Sumi - Visual Token Arbitrage Engine...")
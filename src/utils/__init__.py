@@ -1,8 +1,16 @@
 """Utility modules for OCR compression system."""
 
+import importlib
+
 from .file_discovery import FileDiscovery, FileInfo
-from .token_estimation import TokenEstimationService, get_compression_recommendation
-from .deepseek_insights import DeepSeekInsightsService
+
+# Imported on first access (PEP 562): token estimation pulls in tiktoken, which
+# most pipeline runs never touch
+_LAZY_ATTRIBUTES = {
+    'TokenEstimationService': '.token_estimation',
+    'get_compression_recommendation': '.token_estimation',
+    'DeepSeekInsightsService': '.deepseek_insights',
+}
 
 __all__ = [
     'FileDiscovery',
@@ -12,3 +20,15 @@ __all__ = [
     'DeepSeekInsightsService',
 ]
 
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,16 @@
 """DeepSeek-OCR insights calculation service."""
 
+import copy
 import json
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Parsed config files: {path: ((st_mtime_ns, st_size), config)}; an entry is
+# reused until the file's mtime or size changes
+_CONFIG_CACHE: Dict[Path, tuple] = {}
+
 
 class DeepSeekInsightsService:
     """Service for calculating DeepSeek-OCR insights and metrics."""
@@ -41,18 +47,28 @@ class DeepSeekInsightsService:
             # Default path: configs/deepseek_ocr.json
             config_path = Path(__file__).parent.parent.parent / 'configs' / 'deepseek_ocr.json'
         
-        if config_path.exists():
-            try:
-                config_data = json.loads(config_path.read_text())
-                # Extract deepseek_ocr section if nested
-                if 'deepseek_ocr' in config_data:
-                    return config_data['deepseek_ocr']
-                return config_data
-            except Exception as e:
-                print(f"Warning: Could not load DeepSeek config: {e}")
-                return self.DEFAULT_CONFIG.copy()
-        else:
+        try:
+            st = config_path.stat()
+        except OSError:
             return self.DEFAULT_CONFIG.copy()
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])  # Nested sections must not be shared with the cache
+        
+        try:
+            # json.loads decodes bytes itself, no separate read_text() decode
+            config_data = json.loads(config_path.read_bytes())
+            # Extract deepseek_ocr section if nested
+            if 'deepseek_ocr' in config_data:
+                config_data = config_data['deepseek_ocr']
+        except Exception as e:
+            print(f"Warning: Could not load DeepSeek config: {e}")
+            return self.DEFAULT_CONFIG.copy()
+        
+        _CONFIG_CACHE[config_path] = (stamp, config_data)
+        return copy.deepcopy(config_data)
     
     def calculate_insights(self, file_count: int, pre_tokens: int) -> Dict[str, Any]:
         """
@@ -65,41 +81,67 @@ class DeepSeekInsightsService:
         Returns:
             Dictionary with all insights and metrics
         """
+        config = self.config
+        # The result depends only on these values, so it is memoized on them;
+        # callers get their own copy of the cached dict
+        return dict(self._compute_insights(
+            file_count,
+            pre_tokens,
+            config['compression_ratio'],
+            config['accuracy'],
+            config['throughput_pages_per_day'],
+            config['avg_processing_time_per_page_seconds'],
+            config['text_to_vision_token_ratio'],
+            config.get('model_version', 'DeepSeek-OCR v2.0'),
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compute_insights(
+        file_count: int,
+        pre_tokens: int,
+        compression_ratio,
+        accuracy: float,
+        pages_per_day,
+        avg_processing_time_per_page_seconds: float,
+        text_to_vision_token_ratio: float,
+        model_version: str,
+    ) -> Dict[str, Any]:
+        """Calculate insights from the counts and the config values they use."""
         # Estimate pages (rough: 1 file ≈ 1-3 pages, use 2 as average)
         estimated_pages = file_count * 2
         
         # Calculate processing time
-        processing_time_seconds = estimated_pages * self.config['avg_processing_time_per_page_seconds']
-        processing_time_formatted = self._format_duration(processing_time_seconds)
+        processing_time_seconds = estimated_pages * avg_processing_time_per_page_seconds
+        processing_time_formatted = DeepSeekInsightsService._format_duration(processing_time_seconds)
         
         # Calculate throughput capacity
-        pages_per_day = self.config['throughput_pages_per_day']
         capacity_percentage = (estimated_pages / pages_per_day) * 100 if pages_per_day > 0 else 0
         
         # Calculate vision tokens using same rounding logic as token estimation
         # Apply compression ratio, then round up to nearest 1k to match "After Compression" display
-        compression_ratio = self.config.get('compression_ratio', 10)
         compressed = math.ceil(pre_tokens / compression_ratio)
         vision_tokens_estimate = math.ceil(compressed / 1000) * 1000 if compressed > 0 else 1
         # Safety check: ensure vision tokens never exceed pre_tokens
         vision_tokens_estimate = min(vision_tokens_estimate, pre_tokens)
         
         return {
-            'compression_ratio': self.config['compression_ratio'],
-            'accuracy': self.config['accuracy'],
-            'accuracy_percent': int(self.config['accuracy'] * 100),
+            'compression_ratio': compression_ratio,
+            'accuracy': accuracy,
+            'accuracy_percent': int(accuracy * 100),
             'estimated_pages': estimated_pages,
             'processing_time_seconds': processing_time_seconds,
             'processing_time_formatted': processing_time_formatted,
             'throughput_capacity_percent': round(capacity_percentage, 2),
             'throughput_pages_per_day': pages_per_day,
-            'text_to_vision_token_ratio': self.config['text_to_vision_token_ratio'],
+            'text_to_vision_token_ratio': text_to_vision_token_ratio,
             'vision_tokens_estimate': vision_tokens_estimate,
             'pre_tokens': pre_tokens,
-            'model_version': self.config.get('model_version', 'DeepSeek-OCR v2.0')
+            'model_version': model_version
         }
     
-    def _format_duration(self, seconds: float) -> str:
+    @staticmethod
+    def _format_duration(seconds: float) -> str:
         """
         Format duration in seconds to human-readable string.
         
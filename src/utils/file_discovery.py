@@ -1,11 +1,24 @@
 """File discovery and inventory system for codebase compression."""
 
 import os
+import re
+import sys
 import fnmatch
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+
+
+def _path_suffix(name: str) -> str:
+    """Return the extension of a file name the way Path.suffix does ('' for dotfiles)."""
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ''
 
 
 @dataclass
@@ -17,6 +30,7 @@ class FileInfo:
     file_type: str
     category: str  # 'source', 'config', 'documentation', etc.
     encoding: str = 'utf-8'
+    mtime_ns: int = 0  # Modification time from discovery's stat (0 when unknown)
 
 
 class FileDiscovery:
@@ -48,7 +62,19 @@ class FileDiscovery:
         '.docx',  # Microsoft Word documents (text extraction supported)
     }
     
-    ALL_EXTENSIONS = SOURCE_EXTENSIONS | CONFIG_EXTENSIONS | STYLE_EXTENSIONS | MARKUP_EXTENSIONS | DOCUMENT_EXTENSIONS
+    # Extension -> category in one lookup (the extension sets don't overlap)
+    _EXT_TO_CATEGORY = {
+        **{ext: 'documentation' for ext in DOCUMENT_EXTENSIONS},
+        **{ext: 'markup' for ext in MARKUP_EXTENSIONS},
+        **{ext: 'style' for ext in STYLE_EXTENSIONS},
+        **{ext: 'config' for ext in CONFIG_EXTENSIONS},
+        **{ext: 'source' for ext in SOURCE_EXTENSIONS},
+    }
+    
+    ALL_EXTENSIONS = frozenset(_EXT_TO_CATEGORY)
+    
+    # Markup files with these names are documentation
+    _DOCUMENTATION_NAMES = frozenset({'readme.md', 'readme.txt', 'license', 'changelog'})
     
     # Default exclusion patterns
     DEFAULT_EXCLUSIONS = {
@@ -97,7 +123,10 @@ class FileDiscovery:
         """
         # Clean up path: strip quotes and whitespace, expand user home
         source_dir = str(source_dir).strip().strip("'\"")
-        self.source_dir = Path(source_dir).expanduser().resolve()
+        # Absolute and normalised ('..' collapsed) without resolve()'s per-component
+        # symlink lookups; see source_dir_resolved for the real path
+        self.source_dir = Path(os.path.abspath(Path(source_dir).expanduser()))
+        self._source_parts = self.source_dir.parts
         if not self.source_dir.exists():
             raise ValueError(
                 f"Source directory does not exist: {self.source_dir}\n"
@@ -108,6 +137,7 @@ class FileDiscovery:
         self.exclusions = self.DEFAULT_EXCLUSIONS.copy()
         if exclusions:
             self.exclusions.update(exclusions)
+        self._compile_exclusions()
         
         self.discovered_files: List[FileInfo] = []
         self.stats: Dict[str, int] = {
@@ -117,88 +147,136 @@ class FileDiscovery:
             'total_size': 0,
         }
     
-    def _should_exclude(self, path: Path) -> bool:
-        """Check if a path should be excluded."""
-        # Get relative path string for pattern matching
-        try:
-            relative_path = path.relative_to(self.source_dir)
-            relative_str = str(relative_path)
-            path_str = str(path)
-        except ValueError:
-            # Path is outside source_dir, use absolute path
-            relative_str = str(path)
-            path_str = str(path)
-        
-        # Check each exclusion pattern
+    @cached_property
+    def source_dir_resolved(self) -> Path:
+        """Source directory with symlinks resolved (computed on first use)."""
+        return self.source_dir.resolve()
+    
+    def _compile_exclusions(self):
+        """Split exclusions into an exact-name set and one combined wildcard regex."""
+        exact_names = set()
+        globs = []
         for exclusion in self.exclusions:
-            # Handle wildcard patterns (e.g., *.log, node_modules/*)
             if '*' in exclusion or '?' in exclusion:
-                # Match against relative path and filename
-                if fnmatch.fnmatch(relative_str, exclusion) or fnmatch.fnmatch(path.name, exclusion):
-                    return True
-                # Also check each path component
-                for part in path.parts:
-                    if fnmatch.fnmatch(part, exclusion):
-                        return True
+                # Handle wildcard patterns (e.g., *.log, node_modules/*)
+                globs.append(fnmatch.translate(os.path.normcase(exclusion)))
             else:
-                # Exact match or directory name match
-                if exclusion in path.parts:
+                # Exact match or directory name match (also covers patterns like "node_modules/")
+                exact_names.add(exclusion)
+                exact_names.add(exclusion.rstrip('/'))
+        
+        self._excluded_names = frozenset(exact_names)
+        self._glob_re = re.compile('|'.join(globs)) if globs else None
+        
+        # Exclusions have always matched the source directory's own components;
+        # those never change, so check them once here
+        self._source_excluded = not self._excluded_names.isdisjoint(self._source_parts) or (
+            self._glob_re is not None
+            and any(self._glob_re.match(os.path.normcase(part)) for part in self._source_parts)
+        )
+    
+    def _should_exclude(self, name: str, rel_parts: Tuple[str, ...]) -> bool:
+        """
+        Check if a path should be excluded.
+        
+        Args:
+            name: Final path component (file or directory name)
+            rel_parts: Path components relative to source_dir, ending with name
+        """
+        # Plain string work only - this runs for every directory entry
+        if self._source_excluded or not self._excluded_names.isdisjoint(rel_parts):
+            return True
+        
+        glob_re = self._glob_re
+        if glob_re is not None:
+            # Match against relative path and each path component (including the name)
+            normcase = os.path.normcase
+            if glob_re.match(normcase(os.sep.join(rel_parts))):
+                return True
+            for part in rel_parts:
+                if glob_re.match(normcase(part)):
                     return True
-                # Check if path contains exclusion as substring (for directory patterns like "node_modules/")
-                if exclusion.rstrip('/') in relative_str or exclusion.rstrip('/') in path_str:
-                    # Make sure it's a directory match, not partial string match
-                    exclusion_clean = exclusion.rstrip('/')
-                    parts = relative_str.split(os.sep)
-                    if exclusion_clean in parts:
-                        return True
         
         # Check file extensions (exclude non-text files)
-        if path.suffix and path.suffix.lower() not in self.ALL_EXTENSIONS:
+        suffix = _path_suffix(name)
+        if suffix and suffix.lower() not in self.ALL_EXTENSIONS:
             return True
         
         return False
     
-    def _categorize_file(self, path: Path) -> str:
-        """Categorize a file based on its extension and location."""
-        ext = path.suffix.lower()
-        
-        if ext in self.SOURCE_EXTENSIONS:
-            return 'source'
-        elif ext in self.CONFIG_EXTENSIONS:
-            return 'config'
-        elif ext in self.STYLE_EXTENSIONS:
-            return 'style'
-        elif ext in self.MARKUP_EXTENSIONS:
-            if path.name.lower() in ('readme.md', 'readme.txt', 'license', 'changelog'):
-                return 'documentation'
-            return 'markup'
-        elif ext in self.DOCUMENT_EXTENSIONS:
+    def _categorize_file(self, name: str, ext: str) -> str:
+        """Categorize a file based on its (lowercased) extension and name."""
+        category = self._EXT_TO_CATEGORY.get(ext, 'other')
+        if category == 'markup' and name.lower() in self._DOCUMENTATION_NAMES:
             return 'documentation'
-        else:
-            return 'other'
+        return category
     
-    def _get_file_type(self, path: Path) -> str:
-        """Get file type from extension."""
-        ext = path.suffix.lower()
+    def _get_file_type(self, ext: str) -> str:
+        """Get file type from a lowercased extension."""
         if ext:
             return ext[1:]  # Remove leading dot
         return 'no-extension'
     
-    def _detect_encoding(self, path: Path) -> str:
+    def _detect_encoding(self, path: str) -> str:
         """Detect file encoding (simplified - defaults to utf-8)."""
         # In production, could use chardet or similar
         # For now, default to utf-8 and handle errors during reading
         return 'utf-8'
     
-    def discover(self) -> List[FileInfo]:
+    def _scan_dir(self, dir_path: str, dir_parts: Tuple[str, ...]):
         """
-        Discover all relevant files in the source directory.
+        Read one directory and split it into (files, subdirs).
         
-        Returns:
-            List of FileInfo objects
+        files are (DirEntry, rel_parts) for every non-directory entry; subdirs are
+        (path, rel_parts) for directories to descend into - excluded directories
+        are pruned and directory symlinks are not followed, as with os.walk.
+        DirEntry caches the file type from the directory read, so no extra stat
+        is needed to tell files from directories.
         """
-        self.discovered_files = []
-        self.stats = {
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable directory - skipped, as os.walk does
+            return [], []
+        
+        files = []
+        subdirs = []
+        excluded_names = self._excluded_names
+        for entry in entries:
+            rel_parts = dir_parts + (entry.name,)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append((entry, rel_parts))
+            elif entry.name in excluded_names or entry.is_symlink():
+                # Literal exclusions (node_modules, .git, dist, ...) are rejected on the
+                # name alone - this directory's ancestors already passed _should_exclude
+                continue
+            elif not self._should_exclude(entry.name, rel_parts):
+                subdirs.append((entry.path, rel_parts))
+        return files, subdirs
+    
+    def _walk_scandir(self, dir_path: str, dir_parts: Tuple[str, ...] = ()):
+        """
+        Yield (DirEntry, rel_parts) for every non-directory under dir_path.
+        
+        Same top-down order as os.walk: a directory's files before its
+        subdirectories, subdirectories in scandir order.
+        """
+        stack = [(dir_path, dir_parts)]
+        while stack:
+            files, subdirs = self._scan_dir(*stack.pop())
+            yield from files
+            # Reversed so the first subdirectory is popped (walked) first
+            stack.extend(reversed(subdirs))
+    
+    @staticmethod
+    def _new_stats() -> Dict:
+        """Return empty discovery statistics."""
+        return {
             'total_files': 0,
             'by_type': {},
             'by_category': {},
@@ -206,70 +284,115 @@ class FileDiscovery:
             'unsupported_files': {},  # Track unsupported file types
             'total_scanned': 0,  # Total files encountered (including unsupported)
         }
+    
+    def _collect(self, entries) -> Tuple[List[FileInfo], Dict]:
+        """
+        Turn (DirEntry, rel_parts) pairs into FileInfo objects.
+        
+        Returns:
+            Tuple of (files, stats) for just these entries
+        """
+        discovered_files = []
+        stats = self._new_stats()
+        all_extensions = self.ALL_EXTENSIONS
+        # Counters for the per-file tallies (plain dicts again once merged in discover)
+        by_type = stats['by_type'] = Counter()
+        by_category = stats['by_category'] = Counter()
+        unsupported_files = stats['unsupported_files'] = Counter()
         
-        for root, dirs, files in os.walk(self.source_dir):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not self._should_exclude(Path(root) / d)]
+        for entry, rel_parts in entries:
+            stats['total_scanned'] += 1
             
-            for file in files:
-                file_path = Path(root) / file
-                self.stats['total_scanned'] += 1
-                
-                # Track unsupported extensions BEFORE checking exclusions
-                # (so we can report what file types were found, even if excluded)
-                file_ext = file_path.suffix.lower()
+            # Track unsupported extensions BEFORE checking exclusions
+            # (so we can report what file types were found, even if excluded);
+            # the lowercased extension is reused for the file type and category
+            file_ext = _path_suffix(entry.name).lower()
+            
+            # Skip excluded files
+            if self._should_exclude(entry.name, rel_parts):
+                # Still track unsupported extensions even if excluded
+                if file_ext and file_ext not in all_extensions:
+                    unsupported_files[file_ext] += 1
+                continue
+            
+            # Track unsupported extensions (not excluded, but not supported either)
+            if file_ext and file_ext not in all_extensions:
+                unsupported_files[file_ext] += 1
+                continue
+            
+            try:
+                # Get file size and modification time (DirEntry caches the stat)
+                stat_result = entry.stat()
+                size = stat_result.st_size
                 
-                # Skip excluded files
-                if self._should_exclude(file_path):
-                    # Still track unsupported extensions even if excluded
-                    if file_ext and file_ext not in self.ALL_EXTENSIONS:
-                        if file_ext not in self.stats['unsupported_files']:
-                            self.stats['unsupported_files'][file_ext] = 0
-                        self.stats['unsupported_files'][file_ext] += 1
+                # Skip empty files
+                if size == 0:
                     continue
                 
-                # Track unsupported extensions (not excluded, but not supported either)
-                if file_ext and file_ext not in self.ALL_EXTENSIONS:
-                    if file_ext not in self.stats['unsupported_files']:
-                        self.stats['unsupported_files'][file_ext] = 0
-                    self.stats['unsupported_files'][file_ext] += 1
-                    continue
+                # Create FileInfo
+                file_info = FileInfo(
+                    path=entry.path,
+                    relative_path=os.sep.join(rel_parts),
+                    size=size,
+                    file_type=self._get_file_type(file_ext),
+                    category=self._categorize_file(entry.name, file_ext),
+                    encoding=self._detect_encoding(entry.path),
+                    mtime_ns=stat_result.st_mtime_ns,
+                )
                 
-                try:
-                    # Get file size
-                    size = file_path.stat().st_size
-                    
-                    # Skip empty files
-                    if size == 0:
-                        continue
-                    
-                    # Create FileInfo
-                    relative_path = file_path.relative_to(self.source_dir)
-                    file_info = FileInfo(
-                        path=str(file_path),
-                        relative_path=str(relative_path),
-                        size=size,
-                        file_type=self._get_file_type(file_path),
-                        category=self._categorize_file(file_path),
-                        encoding=self._detect_encoding(file_path),
-                    )
-                    
-                    self.discovered_files.append(file_info)
-                    
-                    # Update statistics
-                    self.stats['total_files'] += 1
-                    self.stats['total_size'] += size
-                    
-                    file_type = file_info.file_type
-                    category = file_info.category
-                    
-                    self.stats['by_type'][file_type] = self.stats['by_type'].get(file_type, 0) + 1
-                    self.stats['by_category'][category] = self.stats['by_category'].get(category, 0) + 1
+                discovered_files.append(file_info)
                 
-                except (OSError, PermissionError) as e:
-                    # Skip files we can't access
-                    print(f"Warning: Could not access {file_path}: {e}")
-                    continue
+                # Update statistics
+                stats['total_files'] += 1
+                stats['total_size'] += size
+                
+                by_type[file_info.file_type] += 1
+                by_category[file_info.category] += 1
+            
+            except (OSError, PermissionError) as e:
+                # Skip files we can't access
+                print(f"Warning: Could not access {entry.path}: {e}")
+                continue
+        
+        return discovered_files, stats
+    
+    def discover(self) -> List[FileInfo]:
+        """
+        Discover all relevant files in the source directory.
+        
+        Top-level subdirectories are walked concurrently (directory reads and
+        stats release the GIL); results are merged in walk order, so the file
+        list and statistics match a sequential top-down scan.
+        
+        Returns:
+            List of FileInfo objects
+        """
+        self.discovered_files = []
+        self.stats = self._new_stats()
+        
+        root_files, subdirs = self._scan_dir(str(self.source_dir), ())
+        results = [self._collect(root_files)]
+        
+        def walk_subtree(subdir):
+            return self._collect(self._walk_scandir(*subdir))
+        
+        if len(subdirs) > 1:
+            max_workers = min(len(subdirs), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results.extend(executor.map(walk_subtree, subdirs))
+        else:
+            results.extend(map(walk_subtree, subdirs))
+        
+        counters = ('by_type', 'by_category', 'unsupported_files')
+        merged = {key: Counter() for key in counters}
+        for files, stats in results:
+            self.discovered_files.extend(files)
+            for key in ('total_files', 'total_size', 'total_scanned'):
+                self.stats[key] += stats[key]
+            for key in counters:
+                merged[key].update(stats[key])
+        for key in counters:
+            self.stats[key] = dict(merged[key])
         
         return self.discovered_files
     
@@ -313,42 +436,50 @@ class FileDiscovery:
     
     def print_summary(self):
         """Print a human-readable summary of discovered files."""
-        print(f"\n{'='*60}")
-        print(f"File Discovery Summary")
-        print(f"{'='*60}")
-        print(f"Source Directory: {self.source_dir}")
-        print(f"Total Files Scanned: {self.stats.get('total_scanned', 0)}")
-        print(f"Total Files Found: {self.stats['total_files']}")
-        print(f"Total Size: {self._format_size(self.stats['total_size'])}")
+        # Built up and written once rather than ~30 separate print() calls
+        rule = '=' * 60
+        lines = [
+            f"\n{rule}\n",
+            "File Discovery Summary\n",
+            f"{rule}\n",
+            f"Source Directory: {self.source_dir_resolved}\n",
+            f"Total Files Scanned: {self.stats.get('total_scanned', 0)}\n",
+            f"Total Files Found: {self.stats['total_files']}\n",
+            f"Total Size: {self._format_size(self.stats['total_size'])}\n",
+        ]
         
         # Show unsupported files if any
         unsupported = self.stats.get('unsupported_files', {})
         if unsupported:
-            print(f"\n⚠️  Unsupported File Types Found:")
+            lines.append("\n⚠️  Unsupported File Types Found:\n")
             for ext, count in sorted(unsupported.items(), key=lambda x: x[1], reverse=True):
                 ext_display = ext if ext else '(no extension)'
-                print(f"  {ext_display:15s}: {count:4d} file(s)")
-            print(f"\n💡 Tip: Sakura Sumi only processes text-based source code files.")
-            print(f"   See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types.")
+                lines.append(f"  {ext_display:15s}: {count:4d} file(s)\n")
+            lines.append("\n💡 Tip: Sakura Sumi only processes text-based source code files.\n")
+            lines.append("   See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types.\n")
         
         if self.stats['by_category']:
-            print(f"\nBreakdown by Category:")
+            lines.append("\nBreakdown by Category:\n")
+            category_row = "  {:15s}: {:4d} files\n".format
             for category, count in sorted(
                 self.stats['by_category'].items(),
                 key=lambda x: x[1],
                 reverse=True
             ):
-                print(f"  {category:15s}: {count:4d} files")
+                lines.append(category_row(category, count))
         
         if self.stats['by_type']:
-            print(f"\nBreakdown by Type:")
+            lines.append("\nBreakdown by Type:\n")
+            type_row = "  .{:10s}: {:4d} files\n".format
             for file_type, count in sorted(
                 self.stats['by_type'].items(),
                 key=lambda x: x[1],
                 reverse=True
             )[:10]:  # Top 10
-                print(f"  .{file_type:10s}: {count:4d} files")
-        print(f"{'='*60}\n")
+                lines.append(type_row(file_type, count))
+        lines.append(f"{rule}\n\n")
+        
+        sys.stdout.write(''.join(lines))
     
     @staticmethod
     def _format_size(size_bytes: int) -> str:
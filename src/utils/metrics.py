@@ -1,5 +1,6 @@
 """Compression metrics and reporting utilities."""
 
+import importlib.util
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -11,13 +12,16 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
-try:
+# matplotlib takes a few hundred ms to import: only look it up here, import it when charting
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+
+
+def _get_pyplot():
+    """Import pyplot on first use with the non-interactive backend."""
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
     import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+    return plt
 
 
 class CompressionMetrics:
@@ -368,6 +372,11 @@ def create_visualizations(metrics: Dict[str, Any], output_dir: Path) -> List[Pat
     if not MATPLOTLIB_AVAILABLE:
         return []
     
+    try:
+        plt = _get_pyplot()
+    except ImportError:
+        return []
+    
     output_dir.mkdir(parents=True, exist_ok=True)
     charts = []
     
@@ -760,7 +760,7 @@ def get_ocr_modes():
     deps = OCRCompressor.check_dependencies()
     
     return jsonify({
-        'modes': modes,
+        'modes': {name: dict(config) for name, config in modes.items()},
         'dependencies_available': deps,
         'ocr_available': deps.get('deepseek_ocr_model', False),
     })
@@ -240,3 +240,41 @@ def test_deepseek_insights_custom_compression_ratio(temp_config_file):
     expected = (100000 / 12)  # ~8333, rounded up to 9k
     assert insights['vision_tokens_estimate'] >= 8000
 
+
+def test_deepseek_insights_config_cache(temp_config_file):
+    """Test that parsed configs are cached per file and reloaded when the file changes."""
+    import os
+    from src.utils import deepseek_insights
+    
+    first = DeepSeekInsightsService(config_path=temp_config_file)
+    first.config['compression_ratio'] = 99  # Must not leak into the cache
+    
+    second = DeepSeekInsightsService(config_path=temp_config_file)
+    assert temp_config_file in deepseek_insights._CONFIG_CACHE
+    assert second.config['compression_ratio'] == 12
+    
+    # Nested values are copied too, so mutating them can't corrupt later loads
+    temp_config_file.write_text(json.dumps({'compression_ratio': 12, 'limits': {'max_pages': 100}}))
+    st = temp_config_file.stat()
+    os.utime(temp_config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    DeepSeekInsightsService(config_path=temp_config_file).config['limits']['max_pages'] = 1
+    assert DeepSeekInsightsService(config_path=temp_config_file).config['limits'] == {'max_pages': 100}
+    
+    temp_config_file.write_text(json.dumps({'compression_ratio': 20, 'accuracy': 0.9}))
+    st = temp_config_file.stat()
+    os.utime(temp_config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 2_000_000_000))
+    
+    reloaded = DeepSeekInsightsService(config_path=temp_config_file)
+    assert reloaded.config['compression_ratio'] == 20
+
+
+def test_deepseek_insights_memoized(insights_service):
+    """Test that repeated calculate_insights calls hit the cache but return independent dicts."""
+    DeepSeekInsightsService._compute_insights.cache_clear()
+    
+    first = insights_service.calculate_insights(25, 50000)
+    first['estimated_pages'] = -1  # Caller mutation must not leak into the cache
+    second = insights_service.calculate_insights(25, 50000)
+    
+    assert DeepSeekInsightsService._compute_insights.cache_info().hits == 1
+    assert second['estimated_pages'] == 50
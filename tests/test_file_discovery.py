@@ -71,3 +71,41 @@ def test_file_discovery_inventory(temp_codebase):
     assert 'files' in report
     assert report['statistics']['total_files'] > 0
 
+
+def test_file_discovery_matches_os_walk_order(temp_codebase):
+    """Test that scandir traversal keeps os.walk's top-down order and pruning."""
+    import os
+    
+    (temp_codebase / 'src' / 'nested').mkdir()
+    (temp_codebase / 'src' / 'nested' / 'deep.py').write_text('x = 1')
+    (temp_codebase / 'lib').mkdir()
+    (temp_codebase / 'lib' / 'helper.js').write_text('export {}')
+    (temp_codebase / 'linked').symlink_to(temp_codebase / 'src', target_is_directory=True)
+    
+    discovery = FileDiscovery(str(temp_codebase))
+    paths = [f.relative_path for f in discovery.discover()]
+    
+    expected = []
+    for root, dirs, files in os.walk(discovery.source_dir):
+        rel_dir = Path(root).relative_to(discovery.source_dir).parts
+        dirs[:] = [d for d in dirs if not discovery._should_exclude(d, rel_dir + (d,))]
+        for name in files:
+            if not discovery._should_exclude(name, rel_dir + (name,)):
+                expected.append(str(Path(root, name).relative_to(discovery.source_dir)))
+    
+    assert paths == expected
+    assert not any(p.startswith('linked') for p in paths)
+
+
+def test_file_discovery_symlinked_source(temp_codebase, tmp_path):
+    """Test that a symlinked source directory is scanned without being resolved up front."""
+    link = tmp_path / 'project_link'
+    link.symlink_to(temp_codebase, target_is_directory=True)
+    
+    discovery = FileDiscovery(str(link / '..' / 'project_link'))
+    files = discovery.discover()
+    
+    assert discovery.source_dir == link
+    assert discovery.source_dir_resolved == temp_codebase.resolve()
+    assert any(f.relative_path == 'src/main.ts' for f in files)
+    assert all(f.path.startswith(str(link)) for f in files)
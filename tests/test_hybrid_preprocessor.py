@@ -60,3 +60,18 @@ def test_prepend_dict_adds_frontmatter():
     assert combined.endswith("body")
 
 
+def test_preprocess_code_replaces_every_mapped_symbol():
+    """Every SYMBOL_MAP entry should be translated and reported."""
+    content = "".join(SYMBOL_MAP)
+    processed, translations = preprocess_code(content, mode="code")
+
+    assert processed == "".join(SYMBOL_MAP.values())
+    assert translations == SYMBOL_MAP
+
+
+def test_preprocess_code_hybrid_adjacent_operators_single_spaced():
+    """Adjacent operators should be padded without leaving double spaces."""
+    processed, _ = preprocess_code("a+=b  c", mode="hybrid")
+
+    assert processed == "a + = b c"
+
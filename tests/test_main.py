@@ -58,3 +58,13 @@ def test_main_valid_directory():
                     # If it fails, that's okay for this test
                     pass
 
+
+def test_build_parser():
+    """Each call should build a fresh parser that handles the CLI flags."""
+    from src.main import _build_parser
+    
+    parser = _build_parser()
+    assert _build_parser() is not parser
+    assert parser.parse_args(['src', '--incremental']).incremental is True
+    assert parser.parse_args(['src']).incremental is False
+    assert parser.parse_args(['src', '--pdf-cache', 'cache']).pdf_cache == 'cache'
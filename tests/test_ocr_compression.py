@@ -174,3 +174,63 @@ def test_ocr_compressor_batch_processing(monkeypatch, tmp_path):
     assert len(progress_calls) == len(pdf_paths)
     assert all(success for _, success in progress_calls)
 
+
+def test_ocr_compressor_modes_read_only():
+    """Mode table should be shared and immutable."""
+    modes = OCRCompressor.get_available_modes()
+
+    with pytest.raises(TypeError):
+        modes['small']['target_ratio'] = 99
+    with pytest.raises(TypeError):
+        modes['custom'] = {}
+    assert OCRCompressor(mode='small').config['target_ratio'] == 7
+
+
+def test_ocr_compressor_error_log_bounded(monkeypatch, tmp_path):
+    """Errors should be kept in a bounded log and reported as dicts."""
+    from src.compression import ocr_compression as oc
+
+    monkeypatch.setattr(oc, 'OCR_AVAILABLE', True)
+    monkeypatch.setattr(oc.OCRCompressor, 'MAX_ERRORS', 2)
+    compressor = oc.OCRCompressor(mode='small', cache_dir=str(tmp_path))
+
+    def fail():
+        raise RuntimeError('model unavailable')
+
+    monkeypatch.setattr(compressor, '_load_model', fail)
+
+    for i in range(3):
+        assert compressor.compress_pdf(tmp_path / f'missing_{i}.pdf') is None
+
+    errors = compressor.get_stats()['errors']
+    assert len(errors) == 2
+    assert errors[-1] == {'file': str(tmp_path / 'missing_2.pdf'), 'error': 'model unavailable'}
+
+
+def test_ocr_compressor_dependency_warning_once(monkeypatch):
+    """Missing-dependency warning should fire only once per process."""
+    import warnings
+    from src.compression import ocr_compression as oc
+
+    monkeypatch.delenv(oc.QUIET_ENV_FLAG, raising=False)
+    monkeypatch.setattr(oc, '_dependency_warning_emitted', False)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        oc.OCRCompressor(mode='small')
+        oc.OCRCompressor(mode='small')
+
+    assert len([w for w in caught if issubclass(w.category, ImportWarning)]) == 1
+
+
+def test_ocr_compressor_dependency_warning_quiet(monkeypatch):
+    """SAKURA_QUIET should suppress the missing-dependency warning."""
+    import warnings
+    from src.compression import ocr_compression as oc
+
+    monkeypatch.setenv(oc.QUIET_ENV_FLAG, '1')
+    monkeypatch.setattr(oc, '_dependency_warning_emitted', False)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        oc.OCRCompressor(mode='small')
+
+    assert not [w for w in caught if issubclass(w.category, ImportWarning)]
@@ -29,6 +29,27 @@ def sample_file_info(temp_output):
     )
 
 
+def _file_info(path, file_type='ts', category='source'):
+    """Build a FileInfo for a file already written under the test directory."""
+    return FileInfo(
+        path=str(path),
+        relative_path=path.name,
+        size=path.stat().st_size,
+        file_type=file_type,
+        category=category,
+    )
+
+
+def _write_sources(directory, sizes):
+    """Create one .ts file per line count and return their FileInfo objects."""
+    files = []
+    for i, line_count in enumerate(sizes):
+        path = directory / f'src{i}.ts'
+        path.write_text('const x = 1;\n' * line_count)
+        files.append(_file_info(path))
+    return files
+
+
 def test_pdf_converter_basic(temp_output, sample_file_info):
     """Test basic PDF conversion."""
     converter = PDFConverter(str(temp_output))
@@ -246,19 +267,155 @@ def test_pdf_converter_malformed_json(temp_output):
     assert pdf_path is None or pdf_path.exists()
 
 
-def test_pdf_converter_fallback_generation(temp_output, sample_file_info, monkeypatch):
-    """Force fallback PDF generation path."""
+def test_pdf_converter_format_cache_size_cap():
+    """Only structured content within FORMAT_CACHE_MAX_CHARS should be memoized."""
+    PDFConverter._format_structured_cached.cache_clear()
+    small = '{"a": 1}'
+    large = '{"items": [' + ', '.join(['1'] * PDFConverter.FORMAT_CACHE_MAX_CHARS) + ']}'
+    
+    assert PDFConverter._format_structured_data(small, 'json') == '{\n  "a": 1\n}'
+    assert PDFConverter._format_structured_data(large, 'json').startswith('{\n  "items": [')
+    
+    assert PDFConverter._format_structured_cached.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_pdf_converter_json_numbers_exact(monkeypatch, use_orjson):
+    """Wide integers and floats should format exactly as the stdlib does, with or without orjson."""
+    from src.compression import pdf_converter as module
+    
+    if not use_orjson:
+        monkeypatch.setattr(module, 'orjson', None)
+    elif module.orjson is None:
+        pytest.skip('orjson not installed')
+    
+    content = '{"id": 12345678901234567890123, "big": 1e20, "n": [-9223372036854775809, 7]}'
+    
+    assert PDFConverter._format_structured(content, 'json') == (
+        '{\n  "id": 12345678901234567890123,\n  "big": 1e+20,\n'
+        '  "n": [\n    -9223372036854775809,\n    7\n  ]\n}'
+    )
+
+
+def test_pdf_converter_generation_error(temp_output, sample_file_info, monkeypatch):
+    """Canvas failures should be recorded instead of raised."""
     from src.compression import pdf_converter as module
     
-    class FailingDoc:
+    class FailingCanvas:
         def __init__(self, *args, **kwargs):
             raise RuntimeError("failure")
     
-    monkeypatch.setattr(module, 'SimpleDocTemplate', FailingDoc)
+    monkeypatch.setattr(module.canvas, 'Canvas', FailingCanvas)
     
     converter = PDFConverter(str(temp_output))
     pdf_path = converter.convert_file(sample_file_info)
     
+    assert pdf_path is None
+    assert any('PDF generation error' in e['error'] for e in converter.conversion_stats['errors'])
+
+
+def test_pdf_converter_hybrid_frontmatter_kept_separate(temp_output, monkeypatch):
+    """Hybrid frontmatter should be passed alongside content, not concatenated."""
+    test_file = temp_output / 'box.ts'
+    test_file.write_text('// ─ divider', encoding='utf-8')
+    file_info = _file_info(test_file)
+    
+    converter = PDFConverter(str(temp_output), hybrid_mode=True)
+    calls = []
+    original = converter._generate_pdf
+    monkeypatch.setattr(
+        converter, '_generate_pdf',
+        lambda info, content, frontmatter='': calls.append((content, frontmatter)) or original(info, content, frontmatter),
+    )
+    
+    assert converter.convert_file(file_info) is not None
+    content, frontmatter = calls[0]
+    assert frontmatter.startswith('---')
+    assert 'U+2500' in frontmatter
+    assert not content.startswith('---')
+
+
+def test_pdf_converter_concatenate_paginates(temp_output):
+    """Concatenated output should stream across pages and keep every file."""
+    files = _write_sources(temp_output, [150, 150, 150])
+    
+    converter = PDFConverter(str(temp_output))
+    pdf_path = converter.concatenate_files_to_pdf(files=files, pdf_name='paged')
+    
     assert pdf_path is not None
-    assert pdf_path.exists()
+    assert pdf_path.read_bytes().count(b'/Type /Page\n') >= 5
+    assert converter.get_stats()['success'] == 3
+
+
+def test_pdf_converter_decoding_fallback(temp_output):
+    """Non-UTF-8 files should fall back to a legacy encoding without replacement characters."""
+    test_file = temp_output / 'legacy.txt'
+    test_file.write_bytes('caf\xe9 \u2013 na\xefve\r\n'.encode('cp1252'))
+    file_info = _file_info(test_file, 'txt', 'documentation')
+    
+    content, error = PDFConverter(str(temp_output))._load_file(file_info)
+    
+    assert error is None
+    assert content == 'caf\xe9 \u2013 na\xefve\n'
+
 
+def test_pdf_converter_concatenate_max_pages(temp_output):
+    """Files that would push a PDF past max_pages should continue in a _part2 PDF."""
+    files = _write_sources(temp_output, [100, 150, 10])
+    
+    converter = PDFConverter(str(temp_output / 'out'))
+    parts = converter.concatenate_files_to_pdfs(files=files, pdf_name='limited', max_pages=2)
+    
+    assert [path.name for path, _, _ in parts] == ['limited.pdf', 'limited_part2.pdf']
+    assert [[f.relative_path for f in included] for _, _, included in parts] == [
+        ['src0.ts', 'src2.ts'],
+        ['src1.ts'],
+    ]
+    for path, size, _ in parts:
+        assert size == path.stat().st_size
+        assert path.read_bytes().count(b'/Type /Page\n') <= 2
+    assert converter.get_stats()['success'] == 3
+
+
+def test_pdf_converter_cache_reuses_pdf(temp_output, sample_file_info, monkeypatch):
+    """Unchanged files should be served from the PDF cache without re-rendering."""
+    cache_dir = temp_output / 'cache'
+    first = PDFConverter(str(temp_output / 'run1'), cache_dir=str(cache_dir))
+    first_pdf = first.convert_file(sample_file_info)
+    assert len(list(cache_dir.glob('*.pdf'))) == 1
+    
+    second = PDFConverter(str(temp_output / 'run2'), cache_dir=str(cache_dir))
+    monkeypatch.setattr(second, '_generate_pdf_simple', lambda *args, **kwargs: pytest.fail('re-rendered'))
+    second_pdf = second.convert_file(sample_file_info)
+    
+    assert second_pdf.read_bytes() == first_pdf.read_bytes()
+    stats = second.get_stats()
+    assert stats['success'] == 1
+    assert stats['files_cached'] == 1
+
+
+def test_pdf_converter_cache_key_covers_layout(temp_output, sample_file_info, monkeypatch):
+    """Layout or cache-version changes should miss entries written under the old settings."""
+    converter = PDFConverter(str(temp_output / 'out'), cache_dir=str(temp_output / 'cache'))
+    key = converter._get_cache_path(sample_file_info, 'content', '')
+    
+    monkeypatch.setattr(PDFConverter, 'MAX_LINE_LENGTH', PDFConverter.MAX_LINE_LENGTH + 10)
+    assert converter._get_cache_path(sample_file_info, 'content', '') != key
+    monkeypatch.undo()
+    
+    monkeypatch.setattr(PDFConverter, '_CACHE_VERSION', PDFConverter._CACHE_VERSION + 1)
+    assert converter._get_cache_path(sample_file_info, 'content', '') != key
+
+
+def test_pdf_converter_gc_pause_only_in_workers(monkeypatch):
+    """GC stays enabled while drawing unless a worker process opted in."""
+    import gc
+    from src.compression import pdf_converter
+    
+    with pdf_converter._gc_paused():
+        assert gc.isenabled()
+    
+    monkeypatch.setattr(pdf_converter, '_gc_pause_enabled', True)
+    with pdf_converter._gc_paused():
+        assert not gc.isenabled()
+    assert gc.isenabled()
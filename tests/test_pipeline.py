@@ -90,6 +90,21 @@ def test_pipeline_no_files(temp_output):
         assert results['error'] == 'No files discovered in the specified directory. Please ensure the directory contains supported source code files. See https://github.com/MichaelWeed/sakura-sumi#file-type-support for supported types.'
 
 
+def test_pipeline_no_supported_files(temp_output):
+    """Both pipeline modes should list the most common unsupported types, top 5 first."""
+    with tempfile.TemporaryDirectory() as source_dir:
+        source = Path(source_dir)
+        for ext, count in [('.bin', 4), ('.dat', 3), ('.exe', 2), ('.so', 1), ('.o', 1), ('.a', 1)]:
+            for i in range(count):
+                (source / f'file{i}{ext}').write_bytes(b'\x00\x01')
+        
+        pipeline = CompressionPipeline(source_dir=source_dir, output_dir=str(temp_output))
+        for results in (pipeline.run(verbose=False), pipeline.run_smart_concatenation(verbose=False)):
+            assert results['success'] is False
+            assert 'unsupported types: .bin (4), .dat (3), .exe (2), ' in results['error']
+            assert 'and 1 more' in results['error']
+
+
 def test_pipeline_checkpoint_recovery(temp_codebase, temp_output):
     """Invalid checkpoint files should be handled gracefully."""
     pipeline = CompressionPipeline(
@@ -181,14 +196,14 @@ def test_pipeline_failure_report(temp_codebase, temp_output, monkeypatch):
         output_dir=str(temp_output),
     )
     
-    original_convert = pipeline.converter.convert_file
+    original_convert = pipeline.converter._convert_file_sized
     
     def fail_first(file_info):
         if file_info.relative_path.endswith('main.ts'):
             raise RuntimeError('boom')
         return original_convert(file_info)
     
-    monkeypatch.setattr(pipeline.converter, 'convert_file', fail_first)
+    monkeypatch.setattr(pipeline.converter, '_convert_file_sized', fail_first)
     
     results = pipeline.run(verbose=False)
     assert results['failed_files']
@@ -197,3 +212,322 @@ def test_pipeline_failure_report(temp_codebase, temp_output, monkeypatch):
     data = json.loads(report_path.read_text())
     assert len(data['failures']) == len(results['failed_files'])
 
+
+@pytest.mark.parametrize('pool_type', ['process', 'thread'])
+def test_pipeline_parallel_pool_types(temp_codebase, temp_output, pool_type):
+    """Both executor types should convert every file and report converter stats."""
+    pipeline = CompressionPipeline(
+        source_dir=str(temp_codebase),
+        output_dir=str(temp_output),
+        parallel=True,
+        max_workers=2,
+        batch_size=1,
+        pool_type=pool_type,
+    )
+    
+    results = pipeline.run(verbose=False)
+    
+    assert results['summary']['files_converted'] == 2
+    assert results['conversion']['success'] == 2
+    assert results['summary']['total_size_pdf_bytes'] > 0
+
+
+def test_pipeline_unguarded_script_falls_back_to_threads(temp_codebase, tmp_path):
+    """A script without a __main__ guard breaks the spawn pool; its work should finish on threads."""
+    import subprocess
+    import sys
+    
+    (temp_codebase / 'docs').mkdir()
+    (temp_codebase / 'docs' / 'guide.md').write_text('# Guide\n')
+    script = tmp_path / 'unguarded.py'
+    script.write_text(
+        'import sys\n'
+        f'sys.path.insert(0, {str(Path(__file__).resolve().parent.parent)!r})\n'
+        'from src.compression.pipeline import CompressionPipeline\n'
+        'for mode in ("files", "groups"):\n'
+        f'    pipeline = CompressionPipeline({str(temp_codebase)!r}, {str(tmp_path)!r} + "/" + mode,\n'
+        '                                   parallel=True, max_workers=2, batch_size=1, pool_type="process")\n'
+        '    run = pipeline.run if mode == "files" else pipeline.run_smart_concatenation\n'
+        '    print("RESULT", run(verbose=False)["summary"]["files_converted"])\n'
+    )
+    
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=120)
+    
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.count('continuing on a thread pool') == 2
+    assert [line for line in result.stdout.splitlines() if line.startswith('RESULT')] == ['RESULT 3', 'RESULT 3']
+
+
+@pytest.mark.parametrize('pool_type', ['process', 'thread'])
+def test_pipeline_pdf_cache_across_runs(temp_codebase, tmp_path, pool_type):
+    """PDFs cached by one run should be reused by the next, including from worker processes."""
+    def run(output_name):
+        pipeline = CompressionPipeline(
+            source_dir=str(temp_codebase),
+            output_dir=str(tmp_path / output_name),
+            parallel=True,
+            max_workers=2,
+            batch_size=1,
+            pool_type=pool_type,
+            cache_dir=str(tmp_path / 'cache'),
+        )
+        return pipeline.run(verbose=False)
+    
+    first = run('first')
+    assert first['conversion']['files_cached'] == 0
+    assert len(list((tmp_path / 'cache').glob('*.pdf'))) == 2
+    
+    second = run('second')
+    assert second['conversion']['files_cached'] == 2
+    assert second['summary']['files_converted'] == 2
+    assert (tmp_path / 'second' / 'src' / 'main.pdf').exists()
+
+
+def test_pipeline_invalid_pool_type(temp_codebase, temp_output):
+    """Unknown executor types should be rejected."""
+    with pytest.raises(ValueError, match='pool_type'):
+        CompressionPipeline(
+            source_dir=str(temp_codebase),
+            output_dir=str(temp_output),
+            pool_type='fiber',
+        )
+
+
+def test_pipeline_pool_type_resolution(temp_codebase, temp_output, monkeypatch):
+    """'auto' should honour SAKURA_POOL, then fall back to the GIL check."""
+    import sys
+    from src.compression import pipeline as module
+    
+    pipeline = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output))
+    assert pipeline.pool_type == 'auto'
+    
+    monkeypatch.setenv(module.POOL_ENV_FLAG, 'thread')
+    assert pipeline._resolve_pool_type() == 'thread'
+    
+    monkeypatch.delenv(module.POOL_ENV_FLAG)
+    monkeypatch.setattr(sys, '_is_gil_enabled', lambda: False, raising=False)
+    assert pipeline._resolve_pool_type() == 'thread'
+    monkeypatch.setattr(sys, '_is_gil_enabled', lambda: True, raising=False)
+    assert pipeline._resolve_pool_type() == 'process'
+    
+    pipeline.pool_type = 'process'
+    monkeypatch.setenv(module.POOL_ENV_FLAG, 'thread')
+    assert pipeline._resolve_pool_type() == 'process'
+
+
+def test_pipeline_checkpoint_log_replay(temp_codebase, temp_output):
+    """Resume should pick up progress appended to the checkpoint log after the last snapshot."""
+    pipeline = CompressionPipeline(
+        source_dir=str(temp_codebase),
+        output_dir=str(temp_output),
+        resume=True,
+    )
+    pipeline.checkpoint_log.write_text(
+        '{"processed":"package.json"}\n'
+        '{"failed":{"file":"src/main.ts","error":"boom"}}\n'
+        '{"processed":"src/ma'  # Torn line from an interrupted write
+    )
+    
+    results = pipeline.run(verbose=False)
+    
+    assert results['summary']['files_converted'] == 1
+    assert results['summary']['files_already_processed'] == 1
+    assert not pipeline.checkpoint_log.exists()
+    snapshot = json.loads(pipeline.checkpoint_file.read_text())
+    assert sorted(snapshot['processed_files']) == ['package.json', 'src/main.ts']
+
+
+def test_pipeline_autotune_workers(temp_codebase, temp_output, monkeypatch):
+    """Auto worker counts should be capped by pool type and by the number of batches."""
+    from src.compression import pipeline as module
+    
+    monkeypatch.setattr(module, 'cpu_count', lambda: 32)
+    pipeline = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output), batch_size=10)
+    
+    pipeline.pool_type = 'process'
+    assert pipeline._autotune_workers(1000) == 8
+    assert pipeline._autotune_workers(25) == 3
+    pipeline.pool_type = 'thread'
+    assert pipeline._autotune_workers(1000) == 16
+    
+    explicit = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output), max_workers=5)
+    assert explicit.autotune_workers is False
+
+
+def test_pipeline_pdf_metrics_skip_stale_outputs(temp_codebase, temp_output):
+    """PDF metrics should cover this run's outputs, not every PDF left in the output tree."""
+    (temp_output / 'stale.pdf').write_bytes(b'x' * 4096)
+    pipeline = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output))
+    
+    results = pipeline.run(verbose=False)
+    
+    pdf_total = sum(
+        (temp_output / path).stat().st_size
+        for path in ('package.pdf', 'src/main.pdf')
+    )
+    assert results['metrics']['pdf']['total_size_bytes'] == pdf_total
+    
+    resumed = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output), resume=True)
+    resumed_results = resumed.run(verbose=False)
+    assert resumed_results['metrics']['pdf']['total_size_bytes'] == pdf_total
+
+
+def test_pipeline_incremental_skips_unchanged(temp_codebase, temp_output):
+    """Incremental runs should only reconvert files changed since the manifest was written."""
+    import os
+    
+    first = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output), incremental=True)
+    assert first.run(verbose=False)['summary']['files_converted'] == 2
+    assert first.manifest_file.exists()
+    
+    second = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output), incremental=True)
+    results = second.run(verbose=False)
+    assert results['summary']['files_converted'] == 0
+    assert results['summary']['files_already_processed'] == 2
+    assert results['metrics']['pdf']['total_size_bytes'] > 0
+    
+    source = temp_codebase / 'src' / 'main.ts'
+    source.write_text('console.log("changed");')
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output), incremental=True)
+    results = third.run(verbose=False)
+    assert results['summary']['files_converted'] == 1
+    assert results['summary']['files_already_processed'] == 1
+
+
+def test_pipeline_cancel_interrupts_retry_backoff(temp_codebase, temp_output, monkeypatch):
+    """Cancelling should cut a retry backoff short instead of sleeping it out."""
+    import threading
+    import time
+    
+    pipeline = CompressionPipeline(
+        source_dir=str(temp_codebase),
+        output_dir=str(temp_output),
+        retry_count=3,
+        retry_delay=30.0,
+    )
+    monkeypatch.setattr(pipeline.converter, '_convert_file_sized', lambda file_info: (None, 0))
+    file_info = pipeline.discovery.discover()[0]
+    
+    timer = threading.Timer(0.1, lambda: setattr(pipeline, 'cancelled', True))
+    timer.start()
+    started = time.monotonic()
+    pdf_path, pdf_size, error = pipeline._convert_file_with_retry(file_info)
+    timer.join()
+    
+    assert pdf_path is None
+    assert error == 'Cancelled'
+    assert time.monotonic() - started < 5
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_pipeline_json_helpers_roundtrip(tmp_path, monkeypatch, use_orjson):
+    """Checkpoint and report JSON should round-trip with and without orjson."""
+    from src.compression import pipeline as module
+    
+    if not use_orjson:
+        monkeypatch.setattr(module, 'orjson', None)
+    elif module.orjson is None:
+        pytest.skip('orjson not installed')
+    
+    data = {'processed_files': ['src/ü.py'], 'failed_files': [{'file': 'a', 'error': 'boom'}]}
+    path = tmp_path / 'state.json'
+    module._write_json(path, data, indent=True)
+    assert module._read_json(path) == data
+    assert path.read_text(encoding='utf-8').startswith('{\n  "processed_files"')
+    assert module._loads(module._dumps(data)) == data
+    assert '\n' not in module._dumps(data)
+    
+    module._write_json(path, {'counts': {1: 'one'}})
+    assert module._read_json(path) == {'counts': {'1': 'one'}}
+
+
+@pytest.mark.parametrize('pool_type', ['thread', 'process'])
+def test_pipeline_smart_concatenation_parallel(temp_codebase, temp_output, pool_type):
+    """Parallel group rendering should produce the same PDFs, in order, as a serial run."""
+    (temp_codebase / 'docs').mkdir()
+    (temp_codebase / 'docs' / 'guide.md').write_text('# Guide\n\nSome text.\n')
+    
+    serial = CompressionPipeline(source_dir=str(temp_codebase), output_dir=str(temp_output / 'serial'))
+    expected = serial.run_smart_concatenation(max_pdfs=3, verbose=False)
+    
+    pipeline = CompressionPipeline(
+        source_dir=str(temp_codebase),
+        output_dir=str(temp_output / 'parallel'),
+        parallel=True,
+        max_workers=2,
+        pool_type=pool_type,
+    )
+    results = pipeline.run_smart_concatenation(max_pdfs=3, verbose=False)
+    
+    groups = results['smart_concatenation']['pdf_groups']
+    assert len(groups) > 1
+    assert [g['name'] for g in groups] == [g['name'] for g in expected['smart_concatenation']['pdf_groups']]
+    assert results['summary']['files_converted'] == expected['summary']['files_converted']
+    assert results['conversion']['success'] == expected['conversion']['success']
+    # Reported sizes come from the rendered bytes, not a stat() of the output
+    for run, run_dir in ((results, 'parallel'), (expected, 'serial')):
+        for group in run['smart_concatenation']['pdf_groups']:
+            assert group['size_bytes'] == (temp_output / run_dir / group['path']).stat().st_size
+
+
+def test_pipeline_smart_concatenation_page_overflow(tmp_path):
+    """Groups longer than max_pages_per_pdf should spill into _partN PDFs without losing files."""
+    source = tmp_path / 'src'
+    source.mkdir()
+    for i in range(30):
+        (source / f'mod{i:02d}.ts').write_text('const x = 1;\n' * 400)
+    
+    pipeline = CompressionPipeline(source_dir=str(source), output_dir=str(tmp_path / 'out'))
+    results = pipeline.run_smart_concatenation(max_pages_per_pdf=100, verbose=False)
+    
+    groups = results['smart_concatenation']['pdf_groups']
+    assert len(groups) > 1
+    assert any('_part2' in g['path'] for g in groups)
+    assert sum(g['file_count'] for g in groups) == 30
+    assert results['summary']['files_converted'] == 30
+    assert results['summary']['files_failed'] == 0
+    for group in groups:
+        assert (tmp_path / 'out' / group['path']).read_bytes().count(b'/Type /Page\n') <= 100
+
+
+def test_pipeline_parallel_bounded_in_flight(temp_codebase, temp_output):
+    """Parallel runs should never have more than max_workers * IN_FLIGHT_PER_WORKER chunks outstanding."""
+    for i in range(12):
+        (temp_codebase / f'mod_{i}.py').write_text(f'x = {i}\n')
+    
+    pipeline = CompressionPipeline(
+        source_dir=str(temp_codebase),
+        output_dir=str(temp_output),
+        parallel=True,
+        max_workers=2,
+        batch_size=1,
+        pool_type='thread',
+    )
+    submitted = []
+    original_submit = pipeline._submit_chunk
+    
+    def tracking_submit(executor, use_processes, chunk):
+        outstanding = sum(1 for future in submitted if not future.done())
+        assert outstanding < pipeline.max_workers * pipeline.IN_FLIGHT_PER_WORKER
+        future = original_submit(executor, use_processes, chunk)
+        submitted.append(future)
+        return future
+    
+    pipeline._submit_chunk = tracking_submit
+    results = pipeline.run(verbose=False)
+    
+    assert len(submitted) == 14
+    assert results['summary']['files_converted'] == 14
+
+
+def test_pipeline_format_size_units():
+    """Sizes should use the largest unit that keeps the value at least 1."""
+    fmt = CompressionPipeline._format_size
+    assert fmt(0) == '0.00 B'
+    assert fmt(1023) == '1023.00 B'
+    assert fmt(1024) == '1.00 KB'
+    assert fmt(1048575) == '1024.00 KB'
+    assert fmt(3 * 1024 ** 3) == '3.00 GB'
+    assert fmt(2048 * 1024 ** 4) == '2048.00 TB'
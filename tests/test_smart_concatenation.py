@@ -224,6 +224,23 @@ def test_roll_up_directories(temp_source_dir):
     # At minimum, verify the function works without error
 
 
+def test_roll_up_directories_tracks_sizes(temp_source_dir):
+    """Merged children's sizes should be added to their parent's total."""
+    engine = SmartConcatenationEngine(temp_source_dir, max_pdfs=1)
+    files = [
+        FileInfo(path=f'/fake/{rel}', relative_path=rel, size=size, file_type='ts', category='source')
+        for rel, size in [('pkg/a.ts', 100), ('pkg/sub/b.ts', 20), ('pkg/sub/deep/c.ts', 3)]
+    ]
+    
+    dir_tree, _ = engine.build_directory_tree(files)
+    dir_sizes = {dir_path: sum(f.size for f in dir_files) for dir_path, dir_files in dir_tree.items()}
+    rolled = engine.roll_up_directories(dir_tree, dir_sizes)
+    
+    assert list(rolled) == ['pkg']
+    assert dir_sizes['pkg'] == 123
+    assert sum(f.size for f in rolled['pkg']) == 123
+
+
 def test_roll_up_directories_within_limit(temp_source_dir):
     """Test roll-up when already within limit."""
     engine = SmartConcatenationEngine(temp_source_dir, max_pdfs=10)
@@ -399,6 +416,10 @@ def test_apply_misc_bucket(temp_source_dir):
     misc_group = next((g for g in result if g.name == 'misc.pdf'), None)
     assert misc_group is not None
     assert len(misc_group.files) > 0
+    
+    # Highest priorities are kept, the rest land in misc in their original order
+    assert [g.name for g in result[:-1]] == ['group9.pdf', 'group8.pdf']
+    assert [f.relative_path for f in misc_group.files] == [f'file{i}.ts' for i in range(8)]
 
 
 def test_group_files_empty_input(temp_source_dir):